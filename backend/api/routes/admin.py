@@ -1,15 +1,20 @@
 """Admin API routes for user and site management."""
-from typing import List, Optional
+from collections import Counter, defaultdict
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Type
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, Query, Depends, Body
-import random
-import string
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+import itertools
 
 from models.schemas import (
     UserResponse, UserCreateAdmin, UserUpdateAdmin, UserListResponse,
+    UserSummary, UserSummaryListResponse,
     UserRole, SiteResponse, SiteCreate, SiteUpdate,
-    ZoneResponse, ZoneCreate, ZoneUpdate,
-    CameraResponse, CameraCreate, CameraUpdate
+    ZoneResponse, ZoneCreate, ZoneUpdate, ZoneSummary,
+    CameraResponse, CameraCreate, CameraUpdate, CameraSummary,
+    USER_LIST_ADAPTER, fast_from_orm
 )
 from core.security import get_current_user
 
@@ -17,6 +22,8 @@ router = APIRouter()
 
 
 # Demo data
+_BOOT_TIME = datetime.now()
+
 DEMO_USERS = [
     {
         "id": "usr-001",
@@ -26,7 +33,7 @@ DEMO_USERS = [
         "organization_id": "org-001",
         "is_active": True,
         "site_ids": ["site-001", "site-002", "site-003"],
-        "created_at": datetime.now().isoformat()
+        "created_at": _BOOT_TIME
     },
     {
         "id": "usr-002",
@@ -36,7 +43,7 @@ DEMO_USERS = [
         "organization_id": "org-001",
         "is_active": True,
         "site_ids": ["site-001"],
-        "created_at": datetime.now().isoformat()
+        "created_at": _BOOT_TIME
     },
     {
         "id": "usr-003",
@@ -46,32 +53,141 @@ DEMO_USERS = [
         "organization_id": "org-001",
         "is_active": True,
         "site_ids": ["site-001", "site-002"],
-        "created_at": datetime.now().isoformat()
+        "created_at": _BOOT_TIME
     }
 ]
 
 DEMO_SITES = [
-    {"id": "site-001", "name": "Main Construction Site", "address": "123 Industrial Ave", "timezone": "America/New_York", "organization_id": "org-001", "is_active": True, "camera_count": 5, "created_at": datetime.now().isoformat()},
-    {"id": "site-002", "name": "Warehouse Complex B", "address": "456 Storage Rd", "timezone": "America/New_York", "organization_id": "org-001", "is_active": True, "camera_count": 3, "created_at": datetime.now().isoformat()},
-    {"id": "site-003", "name": "Manufacturing Plant", "address": "789 Factory Blvd", "timezone": "America/Chicago", "organization_id": "org-001", "is_active": True, "camera_count": 8, "created_at": datetime.now().isoformat()},
+    {"id": "site-001", "name": "Main Construction Site", "address": "123 Industrial Ave", "timezone": "America/New_York", "organization_id": "org-001", "is_active": True, "camera_count": 5, "created_at": _BOOT_TIME},
+    {"id": "site-002", "name": "Warehouse Complex B", "address": "456 Storage Rd", "timezone": "America/New_York", "organization_id": "org-001", "is_active": True, "camera_count": 3, "created_at": _BOOT_TIME},
+    {"id": "site-003", "name": "Manufacturing Plant", "address": "789 Factory Blvd", "timezone": "America/Chicago", "organization_id": "org-001", "is_active": True, "camera_count": 8, "created_at": _BOOT_TIME},
 ]
 
 DEMO_ZONES = [
-    {"id": "zone-001", "name": "Heavy Equipment Area", "zone_type": "exclusion", "site_id": "site-001", "camera_id": "cam-001", "polygon_coordinates": [{"x": 0, "y": 0}, {"x": 100, "y": 0}, {"x": 100, "y": 100}, {"x": 0, "y": 100}], "max_allowed": 0, "is_active": True},
+    {"id": "zone-001", "name": "Heavy Equipment Area", "zone_type": "exclusion", "site_id": "site-001", "camera_id": "cam-001", "polygon_coordinates": [0, 0, 100, 0, 100, 100, 0, 100], "max_allowed": 0, "is_active": True},
     {"id": "zone-002", "name": "Loading Dock", "zone_type": "restricted", "site_id": "site-001", "camera_id": "cam-002", "polygon_coordinates": [], "max_allowed": 5, "is_active": True},
     {"id": "zone-003", "name": "Assembly Line", "zone_type": "mandatory_ppe", "site_id": "site-002", "camera_id": "cam-003", "polygon_coordinates": [], "max_allowed": 10, "is_active": True},
 ]
 
 DEMO_CAMERAS = [
-    {"id": "cam-001", "name": "Entrance Camera", "stream_url": "rtsp://192.168.1.100:554/stream1", "location_description": "Main Entrance", "site_id": "site-001", "policy_id": "policy-001", "is_active": True, "status": "online", "last_frame_at": datetime.now().isoformat()},
-    {"id": "cam-002", "name": "Dock Camera", "stream_url": "rtsp://192.168.1.101:554/stream1", "location_description": "Loading Dock", "site_id": "site-001", "policy_id": "policy-001", "is_active": True, "status": "online", "last_frame_at": datetime.now().isoformat()},
-    {"id": "cam-003", "name": "Line Camera 1", "stream_url": "rtsp://192.168.1.102:554/stream1", "location_description": "Assembly Line", "site_id": "site-002", "policy_id": "policy-002", "is_active": True, "status": "online", "last_frame_at": datetime.now().isoformat()},
+    {"id": "cam-001", "name": "Entrance Camera", "stream_url": "rtsp://192.168.1.100:554/stream1", "location_description": "Main Entrance", "site_id": "site-001", "policy_id": "policy-001", "is_active": True, "status": "online", "last_frame_at": _BOOT_TIME},
+    {"id": "cam-002", "name": "Dock Camera", "stream_url": "rtsp://192.168.1.101:554/stream1", "location_description": "Loading Dock", "site_id": "site-001", "policy_id": "policy-001", "is_active": True, "status": "online", "last_frame_at": _BOOT_TIME},
+    {"id": "cam-003", "name": "Line Camera 1", "stream_url": "rtsp://192.168.1.102:554/stream1", "location_description": "Assembly Line", "site_id": "site-002", "policy_id": "policy-002", "is_active": True, "status": "online", "last_frame_at": _BOOT_TIME},
     {"id": "cam-004", "name": "Storage Camera", "stream_url": "rtsp://192.168.1.103:554/stream1", "location_description": "Storage Area", "site_id": "site-003", "policy_id": "policy-001", "is_active": False, "status": "offline", "last_frame_at": None},
 ]
 
+# Lookup indexes kept in sync with the lists above by the mutating handlers
+_USERS_BY_ID: Dict[str, dict] = {u["id"]: u for u in DEMO_USERS}
+_USERS_BY_EMAIL: Dict[str, dict] = {u["email"].lower(): u for u in DEMO_USERS}
+_SITES_BY_ID: Dict[str, dict] = {s["id"]: s for s in DEMO_SITES}
+_ZONES_BY_ID: Dict[str, dict] = {z["id"]: z for z in DEMO_ZONES}
+_CAMERAS_BY_ID: Dict[str, dict] = {c["id"]: c for c in DEMO_CAMERAS}
+_ZONES_BY_SITE: Dict[str, List[dict]] = defaultdict(list)
+for _zone in DEMO_ZONES:
+    _ZONES_BY_SITE[_zone["site_id"]].append(_zone)
+_CAMERAS_BY_SITE: Dict[str, List[dict]] = defaultdict(list)
+for _camera in DEMO_CAMERAS:
+    _CAMERAS_BY_SITE[_camera["site_id"]].append(_camera)
+
+
+def _id_sequence(records: Iterable[dict]) -> Iterator[int]:
+    """Counter starting after the highest numeric id suffix in ``records``."""
+    return itertools.count(max((int(r["id"].rsplit("-", 1)[1]) for r in records), default=0) + 1)
+
+
+# Monotonic id sequences for newly created records
+_USER_SEQ = _id_sequence(DEMO_USERS)
+_SITE_SEQ = _id_sequence(DEMO_SITES)
+_ZONE_SEQ = _id_sequence(DEMO_ZONES)
+_CAMERA_SEQ = _id_sequence(DEMO_CAMERAS)
+
+# Organization overview, recomputed lazily after any mutation
+_OVERVIEW_CACHE: Dict[str, dict] = {}
+
+# Read-only snapshots of the lists above for the listing routes. Proxies see
+# in-place field updates; the tuples are rebuilt when records are added or removed.
+_READ_VIEWS: Dict[str, Tuple[Mapping, ...]] = {}
+
+
+def _invalidate_overview() -> None:
+    """Drop the cached organization overview after a mutation."""
+    _OVERVIEW_CACHE.clear()
+
+
+def _refresh_read_views() -> None:
+    """Rebuild the read-only snapshots after records are added or removed."""
+    _READ_VIEWS["users"] = tuple(MappingProxyType(u) for u in DEMO_USERS)
+    _READ_VIEWS["sites"] = tuple(MappingProxyType(s) for s in DEMO_SITES)
+    _READ_VIEWS["zones"] = tuple(MappingProxyType(z) for z in DEMO_ZONES)
+    _READ_VIEWS["cameras"] = tuple(MappingProxyType(c) for c in DEMO_CAMERAS)
+    _invalidate_overview()
+
+
+_refresh_read_views()
+
+
+def _paginate(
+    items: Iterable[Mapping],
+    predicate: Callable[[Mapping], bool],
+    start: int,
+    size: int
+) -> Tuple[List[Mapping], int]:
+    """Filter and slice in a single pass, returning the page and total match count."""
+    page = []
+    total = 0
+    end = start + size
+    for item in items:
+        if predicate(item):
+            if start <= total < end:
+                page.append(item)
+            total += 1
+    return page, total
+
+
+# Per-record serializers for the streamed listings, matching their response models
+_ZONE_ADAPTER = TypeAdapter(ZoneResponse)
+_CAMERA_ADAPTER = TypeAdapter(CameraResponse)
+
+
+def _stream_json_array(
+    items: Iterable[Mapping],
+    model: Type[BaseModel],
+    adapter: TypeAdapter
+) -> StreamingResponse:
+    """Stream ``items`` as a JSON array of ``model``, serializing one record per chunk."""
+    def chunks() -> Iterator[bytes]:
+        yield b"["
+        for i, item in enumerate(items):
+            if i:
+                yield b","
+            yield adapter.dump_json(fast_from_orm(model, item))
+        yield b"]"
+
+    return StreamingResponse(chunks(), media_type="application/json")
+
 
 # ================== USER MANAGEMENT ==================
 
+def _page_users(
+    role: Optional[UserRole],
+    is_active: Optional[bool],
+    page: int,
+    page_size: int
+) -> Tuple[List[Mapping], int]:
+    """Return one page of users matching the filters and the match count."""
+    users = _READ_VIEWS["users"]
+    start = (page - 1) * page_size
+    if role is None and is_active is None:
+        # Unfiltered: slice directly, out-of-range pages come back empty in O(1)
+        return list(users[start:start + page_size]), len(users)
+    return _paginate(
+        users,
+        lambda u: (role is None or u["role"] == role) and (is_active is None or u["is_active"] == is_active),
+        start,
+        page_size
+    )
+
+
 @router.get("/users", response_model=UserListResponse)
 async def list_users(
     role: Optional[UserRole] = Query(None),
@@ -81,19 +197,32 @@ async def list_users(
     current_user: dict = Depends(get_current_user)
 ):
     """List all users (admin only)."""
-    filtered = DEMO_USERS.copy()
-    
-    if role:
-        filtered = [u for u in filtered if u["role"] == role]
-    if is_active is not None:
-        filtered = [u for u in filtered if u["is_active"] == is_active]
-    
-    total = len(filtered)
-    start = (page - 1) * page_size
-    end = start + page_size
-    items = filtered[start:end]
-    
-    return UserListResponse(items=items, total=total, page=page, page_size=page_size)
+    items, total = _page_users(role, is_active, page, page_size)
+    # Serialized here in one pass rather than dumped and re-validated by FastAPI
+    return ORJSONResponse({
+        "items": USER_LIST_ADAPTER.dump_python([fast_from_orm(UserResponse, u) for u in items], mode="json"),
+        "total": total,
+        "page": page,
+        "page_size": page_size
+    })
+
+
+@router.get("/users/summary", response_model=UserSummaryListResponse)
+async def list_users_summary(
+    role: Optional[UserRole] = Query(None),
+    is_active: Optional[bool] = Query(None),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    current_user: dict = Depends(get_current_user)
+):
+    """List users with only id, email, name and role (admin only)."""
+    items, total = _page_users(role, is_active, page, page_size)
+    return UserSummaryListResponse.model_construct(
+        items=[fast_from_orm(UserSummary, u) for u in items],
+        total=total,
+        page=page,
+        page_size=page_size
+    )
 
 
 @router.post("/users", response_model=UserResponse)
@@ -103,20 +232,23 @@ async def create_user(
 ):
     """Create a new user (admin only)."""
     # Check if email already exists
-    if any(u["email"] == user.email for u in DEMO_USERS):
+    if user.email.lower() in _USERS_BY_EMAIL:
         raise HTTPException(status_code=400, detail="Email already registered")
     
     new_user = {
-        "id": f"usr-{''.join(random.choices(string.digits, k=3))}",
+        "id": f"usr-{next(_USER_SEQ):03d}",
         "email": user.email,
         "full_name": user.full_name,
         "role": user.role,
         "organization_id": user.organization_id,
         "is_active": True,
         "site_ids": user.site_ids or [],
-        "created_at": datetime.now().isoformat()
+        "created_at": datetime.now()
     }
     DEMO_USERS.append(new_user)
+    _USERS_BY_ID[new_user["id"]] = new_user
+    _USERS_BY_EMAIL[new_user["email"].lower()] = new_user
+    _refresh_read_views()
     return new_user
 
 
@@ -126,10 +258,10 @@ async def get_user(
     current_user: dict = Depends(get_current_user)
 ):
     """Get user details."""
-    for user in DEMO_USERS:
-        if user["id"] == user_id:
-            return user
-    raise HTTPException(status_code=404, detail="User not found")
+    user = _USERS_BY_ID.get(user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return user
 
 
 @router.patch("/users/{user_id}", response_model=UserResponse)
@@ -139,18 +271,12 @@ async def update_user(
     current_user: dict = Depends(get_current_user)
 ):
     """Update user (admin only)."""
-    for user in DEMO_USERS:
-        if user["id"] == user_id:
-            if update.full_name is not None:
-                user["full_name"] = update.full_name
-            if update.role is not None:
-                user["role"] = update.role
-            if update.is_active is not None:
-                user["is_active"] = update.is_active
-            if update.site_ids is not None:
-                user["site_ids"] = update.site_ids
-            return user
-    raise HTTPException(status_code=404, detail="User not found")
+    user = _USERS_BY_ID.get(user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    user.update(update.model_dump(exclude_unset=True, exclude_none=True))
+    _invalidate_overview()
+    return user
 
 
 @router.delete("/users/{user_id}")
@@ -159,12 +285,12 @@ async def delete_user(
     current_user: dict = Depends(get_current_user)
 ):
     """Delete user (admin only)."""
-    global DEMO_USERS
-    original_len = len(DEMO_USERS)
-    DEMO_USERS = [u for u in DEMO_USERS if u["id"] != user_id]
-    
-    if len(DEMO_USERS) == original_len:
+    user = _USERS_BY_ID.pop(user_id, None)
+    if user is None:
         raise HTTPException(status_code=404, detail="User not found")
+    _USERS_BY_EMAIL.pop(user["email"].lower(), None)
+    DEMO_USERS.remove(user)
+    _refresh_read_views()
     return {"message": "User deleted", "user_id": user_id}
 
 
@@ -175,7 +301,7 @@ async def list_sites_admin(
     current_user: dict = Depends(get_current_user)
 ):
     """List all sites."""
-    return DEMO_SITES
+    return _READ_VIEWS["sites"]
 
 
 @router.post("/sites", response_model=SiteResponse)
@@ -185,16 +311,18 @@ async def create_site(
 ):
     """Create a new site."""
     new_site = {
-        "id": f"site-{''.join(random.choices(string.digits, k=3))}",
+        "id": f"site-{next(_SITE_SEQ):03d}",
         "name": site.name,
         "address": site.address,
         "timezone": site.timezone,
         "organization_id": site.organization_id,
         "is_active": True,
         "camera_count": 0,
-        "created_at": datetime.now().isoformat()
+        "created_at": datetime.now()
     }
     DEMO_SITES.append(new_site)
+    _SITES_BY_ID[new_site["id"]] = new_site
+    _refresh_read_views()
     return new_site
 
 
@@ -205,18 +333,12 @@ async def update_site(
     current_user: dict = Depends(get_current_user)
 ):
     """Update site."""
-    for site in DEMO_SITES:
-        if site["id"] == site_id:
-            if update.name is not None:
-                site["name"] = update.name
-            if update.address is not None:
-                site["address"] = update.address
-            if update.timezone is not None:
-                site["timezone"] = update.timezone
-            if update.is_active is not None:
-                site["is_active"] = update.is_active
-            return site
-    raise HTTPException(status_code=404, detail="Site not found")
+    site = _SITES_BY_ID.get(site_id)
+    if site is None:
+        raise HTTPException(status_code=404, detail="Site not found")
+    site.update(update.model_dump(exclude_unset=True, exclude_none=True))
+    _invalidate_overview()
+    return site
 
 
 @router.delete("/sites/{site_id}")
@@ -225,8 +347,10 @@ async def delete_site(
     current_user: dict = Depends(get_current_user)
 ):
     """Delete site."""
-    global DEMO_SITES
-    DEMO_SITES = [s for s in DEMO_SITES if s["id"] != site_id]
+    site = _SITES_BY_ID.pop(site_id, None)
+    if site is not None:
+        DEMO_SITES.remove(site)
+        _refresh_read_views()
     return {"message": "Site deleted", "site_id": site_id}
 
 
@@ -235,12 +359,24 @@ async def delete_site(
 @router.get("/zones", response_model=List[ZoneResponse])
 async def list_zones(
     site_id: Optional[str] = Query(None),
+    stream: bool = Query(False, description="Stream the array in chunks instead of buffering it"),
     current_user: dict = Depends(get_current_user)
 ):
     """List zones."""
-    if site_id:
-        return [z for z in DEMO_ZONES if z["site_id"] == site_id]
-    return DEMO_ZONES
+    zones = _ZONES_BY_SITE.get(site_id, []) if site_id else _READ_VIEWS["zones"]
+    if stream:
+        return _stream_json_array(zones, ZoneResponse, _ZONE_ADAPTER)
+    return zones
+
+
+@router.get("/zones/summary", response_model=List[ZoneSummary])
+async def list_zones_summary(
+    site_id: Optional[str] = Query(None),
+    current_user: dict = Depends(get_current_user)
+):
+    """List zones without polygon coordinates."""
+    zones = _ZONES_BY_SITE.get(site_id, []) if site_id else _READ_VIEWS["zones"]
+    return [fast_from_orm(ZoneSummary, z) for z in zones]
 
 
 @router.post("/zones", response_model=ZoneResponse)
@@ -250,7 +386,7 @@ async def create_zone(
 ):
     """Create a new zone."""
     new_zone = {
-        "id": f"zone-{''.join(random.choices(string.digits, k=3))}",
+        "id": f"zone-{next(_ZONE_SEQ):03d}",
         "name": zone.name,
         "zone_type": zone.zone_type,
         "site_id": zone.site_id,
@@ -260,6 +396,9 @@ async def create_zone(
         "is_active": True
     }
     DEMO_ZONES.append(new_zone)
+    _ZONES_BY_ID[new_zone["id"]] = new_zone
+    _ZONES_BY_SITE[new_zone["site_id"]].append(new_zone)
+    _refresh_read_views()
     return new_zone
 
 
@@ -270,20 +409,11 @@ async def update_zone(
     current_user: dict = Depends(get_current_user)
 ):
     """Update zone."""
-    for zone in DEMO_ZONES:
-        if zone["id"] == zone_id:
-            if update.name is not None:
-                zone["name"] = update.name
-            if update.zone_type is not None:
-                zone["zone_type"] = update.zone_type
-            if update.polygon_coordinates is not None:
-                zone["polygon_coordinates"] = update.polygon_coordinates
-            if update.max_allowed is not None:
-                zone["max_allowed"] = update.max_allowed
-            if update.is_active is not None:
-                zone["is_active"] = update.is_active
-            return zone
-    raise HTTPException(status_code=404, detail="Zone not found")
+    zone = _ZONES_BY_ID.get(zone_id)
+    if zone is None:
+        raise HTTPException(status_code=404, detail="Zone not found")
+    zone.update(update.model_dump(exclude_unset=True, exclude_none=True))
+    return zone
 
 
 @router.delete("/zones/{zone_id}")
@@ -292,8 +422,11 @@ async def delete_zone(
     current_user: dict = Depends(get_current_user)
 ):
     """Delete zone."""
-    global DEMO_ZONES
-    DEMO_ZONES = [z for z in DEMO_ZONES if z["id"] != zone_id]
+    zone = _ZONES_BY_ID.pop(zone_id, None)
+    if zone is not None:
+        DEMO_ZONES.remove(zone)
+        _ZONES_BY_SITE[zone["site_id"]].remove(zone)
+        _refresh_read_views()
     return {"message": "Zone deleted", "zone_id": zone_id}
 
 
@@ -302,12 +435,24 @@ async def delete_zone(
 @router.get("/cameras", response_model=List[CameraResponse])
 async def list_cameras_admin(
     site_id: Optional[str] = Query(None),
+    stream: bool = Query(False, description="Stream the array in chunks instead of buffering it"),
     current_user: dict = Depends(get_current_user)
 ):
     """List cameras."""
-    if site_id:
-        return [c for c in DEMO_CAMERAS if c["site_id"] == site_id]
-    return DEMO_CAMERAS
+    cameras = _CAMERAS_BY_SITE.get(site_id, []) if site_id else _READ_VIEWS["cameras"]
+    if stream:
+        return _stream_json_array(cameras, CameraResponse, _CAMERA_ADAPTER)
+    return cameras
+
+
+@router.get("/cameras/summary", response_model=List[CameraSummary])
+async def list_cameras_summary(
+    site_id: Optional[str] = Query(None),
+    current_user: dict = Depends(get_current_user)
+):
+    """List cameras with only id, name, site and status."""
+    cameras = _CAMERAS_BY_SITE.get(site_id, []) if site_id else _READ_VIEWS["cameras"]
+    return [fast_from_orm(CameraSummary, c) for c in cameras]
 
 
 @router.post("/cameras", response_model=CameraResponse)
@@ -317,7 +462,7 @@ async def create_camera(
 ):
     """Create a new camera."""
     new_camera = {
-        "id": f"cam-{''.join(random.choices(string.digits, k=3))}",
+        "id": f"cam-{next(_CAMERA_SEQ):03d}",
         "name": camera.name,
         "stream_url": camera.stream_url,
         "location_description": camera.location_description,
@@ -328,11 +473,14 @@ async def create_camera(
         "last_frame_at": None
     }
     DEMO_CAMERAS.append(new_camera)
+    _CAMERAS_BY_ID[new_camera["id"]] = new_camera
+    _CAMERAS_BY_SITE[new_camera["site_id"]].append(new_camera)
+    _refresh_read_views()
     
     # Update site camera count
-    for site in DEMO_SITES:
-        if site["id"] == camera.site_id:
-            site["camera_count"] = len([c for c in DEMO_CAMERAS if c["site_id"] == camera.site_id])
+    site = _SITES_BY_ID.get(camera.site_id)
+    if site is not None:
+        site["camera_count"] = len(_CAMERAS_BY_SITE[camera.site_id])
     
     return new_camera
 
@@ -344,21 +492,15 @@ async def update_camera(
     current_user: dict = Depends(get_current_user)
 ):
     """Update camera."""
-    for camera in DEMO_CAMERAS:
-        if camera["id"] == camera_id:
-            if update.name is not None:
-                camera["name"] = update.name
-            if update.stream_url is not None:
-                camera["stream_url"] = update.stream_url
-            if update.location_description is not None:
-                camera["location_description"] = update.location_description
-            if update.is_active is not None:
-                camera["is_active"] = update.is_active
-                camera["status"] = "online" if update.is_active else "offline"
-            if update.policy_id is not None:
-                camera["policy_id"] = update.policy_id
-            return camera
-    raise HTTPException(status_code=404, detail="Camera not found")
+    camera = _CAMERAS_BY_ID.get(camera_id)
+    if camera is None:
+        raise HTTPException(status_code=404, detail="Camera not found")
+    patch = update.model_dump(exclude_unset=True, exclude_none=True)
+    camera.update(patch)
+    if "is_active" in patch:
+        camera["status"] = "online" if camera["is_active"] else "offline"
+    _invalidate_overview()
+    return camera
 
 
 @router.delete("/cameras/{camera_id}")
@@ -367,8 +509,16 @@ async def delete_camera_admin(
     current_user: dict = Depends(get_current_user)
 ):
     """Delete camera."""
-    global DEMO_CAMERAS
-    DEMO_CAMERAS = [c for c in DEMO_CAMERAS if c["id"] != camera_id]
+    camera = _CAMERAS_BY_ID.pop(camera_id, None)
+    if camera is not None:
+        DEMO_CAMERAS.remove(camera)
+        _CAMERAS_BY_SITE[camera["site_id"]].remove(camera)
+        _refresh_read_views()
+        
+        # Update site camera count
+        site = _SITES_BY_ID.get(camera["site_id"])
+        if site is not None:
+            site["camera_count"] = len(_CAMERAS_BY_SITE[camera["site_id"]])
     return {"message": "Camera deleted", "camera_id": camera_id}
 
 
@@ -379,18 +529,20 @@ async def get_organization_overview(
     current_user: dict = Depends(get_current_user)
 ):
     """Get organization overview stats."""
-    return {
-        "total_users": len(DEMO_USERS),
-        "active_users": len([u for u in DEMO_USERS if u["is_active"]]),
-        "total_sites": len(DEMO_SITES),
-        "active_sites": len([s for s in DEMO_SITES if s["is_active"]]),
-        "total_zones": len(DEMO_ZONES),
-        "total_cameras": len(DEMO_CAMERAS),
-        "online_cameras": len([c for c in DEMO_CAMERAS if c["status"] == "online"]),
-        "users_by_role": {
-            "admin": len([u for u in DEMO_USERS if u["role"] == UserRole.ADMIN]),
-            "safety_officer": len([u for u in DEMO_USERS if u["role"] == UserRole.SAFETY_OFFICER]),
-            "operator": len([u for u in DEMO_USERS if u["role"] == UserRole.OPERATOR]),
-            "viewer": len([u for u in DEMO_USERS if u["role"] == UserRole.VIEWER]),
+    overview = _OVERVIEW_CACHE.get("overview")
+    if overview is None:
+        users, sites = _READ_VIEWS["users"], _READ_VIEWS["sites"]
+        cameras = _READ_VIEWS["cameras"]
+        users_by_role = Counter(u["role"] for u in users)
+        overview = {
+            "total_users": len(users),
+            "active_users": sum(1 for u in users if u["is_active"]),
+            "total_sites": len(sites),
+            "active_sites": sum(1 for s in sites if s["is_active"]),
+            "total_zones": len(_READ_VIEWS["zones"]),
+            "total_cameras": len(cameras),
+            "online_cameras": sum(1 for c in cameras if c["status"] == "online"),
+            "users_by_role": {role.value: users_by_role[role] for role in UserRole},
         }
-    }
+        _OVERVIEW_CACHE["overview"] = overview
+    return overview
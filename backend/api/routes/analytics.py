@@ -1,7 +1,10 @@
 """Analytics and reporting routes."""
-from typing import List, Optional
+from typing import List, Literal, Optional, Tuple
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Query, Depends
+from functools import lru_cache
+from fastapi import APIRouter, Query, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
+from fastapi_cache.decorator import cache
 from models.schemas import (
     DateRangeFilter, SafetyScoreData, IncidentTrendData,
     LocationRiskData, KPIDashboardData
@@ -11,6 +14,45 @@ from core.security import get_current_user
 
 router = APIRouter()
 
+# Slow-changing analytics are cached for five minutes per caller
+ANALYTICS_CACHE_EXPIRE = 300
+
+
+def _user_scoped_key_builder(
+    func,
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: tuple = (),
+    kwargs: Optional[dict] = None
+) -> str:
+    """Build a cache key from the route, its query parameters and the caller."""
+    kwargs = kwargs or {}
+    current_user = kwargs.get("current_user") or {}
+    params = ":".join(f"{k}={v}" for k, v in sorted(kwargs.items()) if k != "current_user")
+    path = request.url.path if request else func.__name__
+    return f"{namespace}:{path}:{params}:{current_user.get('user_id')}"
+
+
+def _demo_anchor() -> datetime:
+    """Current time truncated to the hour, so cached demo data refreshes hourly."""
+    return datetime.now().replace(minute=0, second=0, microsecond=0)
+
+
+@lru_cache(maxsize=64)
+def _make_demo_incidents(count: int, step: timedelta, anchor: datetime) -> Tuple[dict, ...]:
+    """Build demo incidents spaced ``step`` apart going back from ``anchor``.
+
+    Returned as a tuple so the cached result can be shared across requests;
+    callers must not mutate the records.
+    """
+    return tuple(
+        {"severity": "high", "detected_at": anchor - step * i,
+         "violation_type": "ppe_violation", "site_id": "site-001"}
+        for i in range(count)
+    )
+
 
 @router.get("/dashboard", response_model=KPIDashboardData)
 async def get_dashboard_data(
@@ -20,23 +62,21 @@ async def get_dashboard_data(
 ):
     """Get comprehensive dashboard data with all KPIs."""
     # Demo data - replace with actual database queries
-    demo_incidents = [
-        {"severity": "high", "detected_at": datetime.now() - timedelta(days=i), 
-         "violation_type": "ppe_violation", "site_id": "site-001"}
-        for i in range(15)
-    ]
+    demo_incidents = _make_demo_incidents(15, timedelta(days=1), _demo_anchor())
+    # Read the records into columns once; both computations share them
+    incident_columns = analytics_service.to_columns(demo_incidents)
     
     safety_score = await analytics_service.calculate_safety_score(
-        incidents=demo_incidents,
+        incidents=incident_columns,
         near_misses=[],
         corrective_actions=[],
         total_work_hours=160000,
         period_days=days
     )
     
-    trends = await analytics_service.get_incident_trends(demo_incidents, days)
+    trends = await analytics_service.get_incident_trends(incident_columns, days)
     
-    return KPIDashboardData(
+    dashboard = KPIDashboardData(
         safety_score=safety_score,
         incident_trends=trends,
         location_risks=[],
@@ -46,9 +86,12 @@ async def get_dashboard_data(
         mean_time_to_detect=2.5,
         mean_time_to_resolve=24.0
     )
+    # Dump once straight to JSON types instead of FastAPI re-validating the model
+    return ORJSONResponse(dashboard.model_dump(mode="json"))
 
 
 @router.get("/safety-score", response_model=SafetyScoreData)
+@cache(expire=ANALYTICS_CACHE_EXPIRE, key_builder=_user_scoped_key_builder)
 async def get_safety_score(
     site_id: Optional[str] = Query(None),
     days: int = Query(30, ge=1, le=365),
@@ -71,18 +114,16 @@ async def get_safety_score(
 async def get_incident_trends(
     site_id: Optional[str] = Query(None),
     days: int = Query(30, ge=1, le=365),
-    granularity: str = Query("daily", regex="^(daily|weekly|monthly)$"),
+    granularity: Literal["daily", "weekly", "monthly"] = Query("daily"),
     current_user: dict = Depends(get_current_user)
 ):
     """Get incident trends over time."""
-    demo_incidents = [
-        {"severity": "high", "detected_at": datetime.now() - timedelta(days=i)}
-        for i in range(days)
-    ]
+    demo_incidents = _make_demo_incidents(days, timedelta(days=1), _demo_anchor())
     return await analytics_service.get_incident_trends(demo_incidents, days, granularity)
 
 
 @router.get("/location-risks", response_model=List[LocationRiskData])
+@cache(expire=ANALYTICS_CACHE_EXPIRE, key_builder=_user_scoped_key_builder)
 async def get_location_risks(
     days: int = Query(30, ge=1, le=365),
     current_user: dict = Depends(get_current_user)
@@ -111,9 +152,10 @@ async def get_root_cause_analysis(
     current_user: dict = Depends(get_current_user)
 ):
     """Get root cause analysis for incidents."""
+    now = datetime.now()
     demo_incidents = [
-        {"violation_type": "ppe_violation", "detected_at": datetime.now()},
-        {"violation_type": "proximity_violation", "detected_at": datetime.now()}
+        {"violation_type": "ppe_violation", "detected_at": now},
+        {"violation_type": "proximity_violation", "detected_at": now}
     ]
     return await analytics_service.get_root_cause_analysis(demo_incidents)
 
@@ -125,14 +167,12 @@ async def get_shift_analysis(
     current_user: dict = Depends(get_current_user)
 ):
     """Get incident analysis by shift and team."""
-    demo_incidents = [
-        {"severity": "high", "detected_at": datetime.now() - timedelta(hours=i * 3)}
-        for i in range(24)
-    ]
+    demo_incidents = _make_demo_incidents(24, timedelta(hours=3), _demo_anchor())
     return await analytics_service.get_team_shift_analysis(demo_incidents)
 
 
 @router.get("/action-effectiveness")
+@cache(expire=ANALYTICS_CACHE_EXPIRE, key_builder=_user_scoped_key_builder)
 async def get_action_effectiveness(
     days: int = Query(90, ge=1, le=365),
     current_user: dict = Depends(get_current_user)
@@ -149,6 +189,7 @@ async def get_action_effectiveness(
 
 
 @router.get("/benchmarks")
+@cache(expire=ANALYTICS_CACHE_EXPIRE, key_builder=_user_scoped_key_builder)
 async def get_benchmarks(
     current_user: dict = Depends(get_current_user)
 ):
@@ -166,6 +207,7 @@ async def get_benchmarks(
 
 
 @router.get("/predictive")
+@cache(expire=ANALYTICS_CACHE_EXPIRE, key_builder=_user_scoped_key_builder)
 async def get_predictive_analytics(
     site_id: Optional[str] = Query(None),
     days_ahead: int = Query(7, ge=1, le=30),
@@ -188,6 +230,7 @@ async def get_predictive_analytics(
 
 
 @router.get("/near-miss-trends")
+@cache(expire=ANALYTICS_CACHE_EXPIRE, key_builder=_user_scoped_key_builder)
 async def get_near_miss_trends(
     site_id: Optional[str] = Query(None),
     days: int = Query(30, ge=1, le=365),
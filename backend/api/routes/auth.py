@@ -20,6 +20,8 @@ async def login(request: LoginRequest):
         "role": "admin"
     }
     
+    # Signed per login so each token's exp follows ACCESS_TOKEN_EXPIRE_MINUTES
+    # exactly; repeat verification is what core.security caches
     return TokenResponse(
         access_token=create_access_token(user_data),
         refresh_token=create_refresh_token(user_data)
@@ -1,59 +1,85 @@
 """Forensics and Violations API routes."""
-from typing import List, Optional
-from datetime import datetime, timedelta
-from fastapi import APIRouter, HTTPException, Query, Depends, Body
-from fastapi.responses import FileResponse
-import random
-import string
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Set
+from datetime import date, datetime, time, timedelta
+from fastapi import APIRouter, HTTPException, Query, Depends, Body, UploadFile, File
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
+import numpy as np
+import os
+import secrets
 
 from models.schemas import (
     ViolationResponse, ViolationComment, ViolationCommentCreate,
     ViolationEvidence, ForensicsSearchRequest, ForensicsSearchResponse,
     FalsePositiveRequest, DetectionType, IncidentSeverity, IncidentStatus,
-    MediaType
+    MediaType, VIOLATION_LIST_ADAPTER, fast_from_orm
 )
 from core.security import get_current_user
 
 router = APIRouter()
 
 
-# Demo data generator
+# Demo data generator inputs
+_SITES = [
+    {"id": "site-001", "name": "Main Construction Site"},
+    {"id": "site-002", "name": "Warehouse Complex B"},
+    {"id": "site-003", "name": "Manufacturing Plant"},
+]
+_ZONES = [
+    {"id": "zone-001", "name": "Heavy Equipment Area", "site_id": "site-001"},
+    {"id": "zone-002", "name": "Loading Dock", "site_id": "site-001"},
+    {"id": "zone-003", "name": "Assembly Line", "site_id": "site-002"},
+    {"id": "zone-004", "name": "Storage Area", "site_id": "site-003"},
+]
+_CAMERAS = [
+    {"id": "cam-001", "name": "Entrance Camera", "zone_id": "zone-001"},
+    {"id": "cam-002", "name": "Dock Camera", "zone_id": "zone-002"},
+    {"id": "cam-003", "name": "Line Camera 1", "zone_id": "zone-003"},
+    {"id": "cam-004", "name": "Storage Camera", "zone_id": "zone-004"},
+]
+_SITES_BY_ID = {s["id"]: s for s in _SITES}
+_ZONES_BY_ID = {z["id"]: z for z in _ZONES}
+_DETECTION_TYPES = list(DetectionType)
+_SEVERITIES = list(IncidentSeverity)
+_STATUSES = list(IncidentStatus)
+
+
 def generate_demo_violations(count: int = 50) -> List[dict]:
     """Generate demo violation data."""
-    sites = [
-        {"id": "site-001", "name": "Main Construction Site"},
-        {"id": "site-002", "name": "Warehouse Complex B"},
-        {"id": "site-003", "name": "Manufacturing Plant"},
-    ]
-    zones = [
-        {"id": "zone-001", "name": "Heavy Equipment Area", "site_id": "site-001"},
-        {"id": "zone-002", "name": "Loading Dock", "site_id": "site-001"},
-        {"id": "zone-003", "name": "Assembly Line", "site_id": "site-002"},
-        {"id": "zone-004", "name": "Storage Area", "site_id": "site-003"},
-    ]
-    cameras = [
-        {"id": "cam-001", "name": "Entrance Camera", "zone_id": "zone-001"},
-        {"id": "cam-002", "name": "Dock Camera", "zone_id": "zone-002"},
-        {"id": "cam-003", "name": "Line Camera 1", "zone_id": "zone-003"},
-        {"id": "cam-004", "name": "Storage Camera", "zone_id": "zone-004"},
-    ]
+    now = datetime.now()
+    # Draw every stochastic field up front in a few vectorized calls
+    rng = np.random.default_rng()
+    camera_idx = rng.integers(0, len(_CAMERAS), count).tolist()
+    type_idx = rng.integers(0, len(_DETECTION_TYPES), count).tolist()
+    severity_idx = rng.integers(0, len(_SEVERITIES), count).tolist()
+    status_idx = rng.integers(0, len(_STATUSES), count).tolist()
+    confidences = rng.uniform(0.75, 0.99, count).round(3).tolist()
+    day_offsets = rng.integers(0, 31, count).tolist()
+    hour_offsets = rng.integers(0, 24, count).tolist()
+    resolve_hours = rng.integers(1, 49, count).tolist()
+    is_false_positive = (rng.random(count) < 0.05).tolist()
+    object_confidences = rng.uniform(0.85, 0.99, count).round(2).tolist()
+    is_video = (rng.random(count) > 0.3).tolist()
+    durations = rng.uniform(10, 15, count).round(1).tolist()
+    file_sizes = rng.integers(500000, 5000001, count).tolist()
     
     violations = []
     for i in range(count):
-        camera = random.choice(cameras)
-        zone = next((z for z in zones if z["id"] == camera["zone_id"]), zones[0])
-        site = next((s for s in sites if s["id"] == zone["site_id"]), sites[0])
-        detection_type = random.choice(list(DetectionType))
-        severity = random.choice(list(IncidentSeverity))
-        status = random.choice(list(IncidentStatus))
-        confidence = random.uniform(0.75, 0.99)
-        detected_at = datetime.now() - timedelta(days=random.randint(0, 30), hours=random.randint(0, 23))
+        camera = _CAMERAS[camera_idx[i]]
+        zone = _ZONES_BY_ID[camera["zone_id"]]
+        site = _SITES_BY_ID[zone["site_id"]]
+        detection_type = _DETECTION_TYPES[type_idx[i]]
+        severity = _SEVERITIES[severity_idx[i]]
+        status = _STATUSES[status_idx[i]]
+        detected_at = now - timedelta(days=day_offsets[i], hours=hour_offsets[i])
         
         violations.append({
             "id": f"VIO-{i+1:05d}",
             "detection_type": detection_type,
             "severity": severity,
-            "confidence_score": round(confidence, 3),
+            "confidence_score": confidences[i],
             "description": f"Detected {detection_type.value.replace('_', ' ')} violation",
             "camera_id": camera["id"],
             "camera_name": camera["name"],
@@ -62,29 +88,29 @@ def generate_demo_violations(count: int = 50) -> List[dict]:
             "zone_id": zone["id"],
             "zone_name": zone["name"],
             "status": status,
-            "is_false_positive": random.random() < 0.05,
+            "is_false_positive": is_false_positive[i],
             "false_positive_reason": None,
             "false_positive_marked_by": None,
             "detected_objects": [
-                {"type": "person", "confidence": round(random.uniform(0.85, 0.99), 2), "bbox": [100, 100, 200, 300]}
+                {"type": "person", "confidence": object_confidences[i], "bbox": [100, 100, 200, 300]}
             ],
             "evidence": [
                 {
                     "id": f"EVD-{i+1:05d}-001",
                     "violation_id": f"VIO-{i+1:05d}",
-                    "media_type": MediaType.VIDEO if random.random() > 0.3 else MediaType.IMAGE,
+                    "media_type": MediaType.VIDEO if is_video[i] else MediaType.IMAGE,
                     "original_url": f"/media/evidence/{i+1:05d}_original.mp4",
                     "blurred_url": f"/media/evidence/{i+1:05d}_blurred.mp4",
                     "thumbnail_url": f"/media/evidence/{i+1:05d}_thumb.jpg",
-                    "duration_seconds": round(random.uniform(10, 15), 1),
-                    "file_size_bytes": random.randint(500000, 5000000),
-                    "created_at": detected_at.isoformat()
+                    "duration_seconds": durations[i],
+                    "file_size_bytes": file_sizes[i],
+                    "created_at": detected_at
                 }
             ],
             "comments": [],
             "comment_count": 0,
-            "detected_at": detected_at.isoformat(),
-            "resolved_at": (detected_at + timedelta(hours=random.randint(1, 48))).isoformat() if status == IncidentStatus.RESOLVED else None,
+            "detected_at": detected_at,
+            "resolved_at": detected_at + timedelta(hours=resolve_hours[i]) if status == IncidentStatus.RESOLVED else None,
             "resolved_by": "John Doe" if status == IncidentStatus.RESOLVED else None
         })
     
@@ -93,6 +119,138 @@ def generate_demo_violations(count: int = 50) -> List[dict]:
 
 # Store demo data in memory
 DEMO_VIOLATIONS = generate_demo_violations(100)
+DEMO_VIOLATIONS_BY_ID: Dict[str, dict] = {v["id"]: v for v in DEMO_VIOLATIONS}
+# Comment id -> comment, across all violations
+COMMENTS_BY_ID: Dict[str, dict] = {}
+
+
+def _build_index(field: str) -> Dict[Any, Set[str]]:
+    """Map each value of ``field`` to the ids of the violations carrying it."""
+    index: Dict[Any, Set[str]] = {}
+    for v in DEMO_VIOLATIONS:
+        index.setdefault(v[field], set()).add(v["id"])
+    return index
+
+
+# Inverted indexes over the equality-filterable search fields
+INDEX_BY_SITE = _build_index("site_id")
+INDEX_BY_ZONE = _build_index("zone_id")
+INDEX_BY_CAMERA = _build_index("camera_id")
+INDEX_BY_DETECTION_TYPE = _build_index("detection_type")
+INDEX_BY_SEVERITY = _build_index("severity")
+INDEX_BY_STATUS = _build_index("status")
+
+# Newest-first view for date-range bisection; keys are negated timestamps so they ascend
+SORTED_DESC = sorted(DEMO_VIOLATIONS, key=lambda v: v["detected_at"], reverse=True)
+SORTED_DESC_KEYS = [-v["detected_at"].timestamp() for v in SORTED_DESC]
+SORTED_DESC_RANK: Dict[str, int] = {v["id"]: rank for rank, v in enumerate(SORTED_DESC)}
+# Ranks in oldest-first order, ties kept in load order as a stable ascending sort would
+SORTED_ASC_RANKS = np.array(
+    sorted(range(len(SORTED_DESC)), key=lambda rank: SORTED_DESC[rank]["detected_at"]), dtype=np.int64
+)
+# Column arrays aligned with SORTED_DESC for vectorized residual filters
+SORTED_CONFIDENCE = np.fromiter((v["confidence_score"] for v in SORTED_DESC), dtype=np.float64, count=len(SORTED_DESC))
+SORTED_FALSE_POSITIVE = np.fromiter((v["is_false_positive"] for v in SORTED_DESC), dtype=bool, count=len(SORTED_DESC))
+
+
+def _new_stats_bucket() -> dict:
+    """Empty running totals for the stats summary."""
+    return {
+        "count": 0,
+        "by_type": Counter(),
+        "by_severity": Counter(),
+        "high_confidence": 0,
+        "false_positives": 0,
+        "resolved": 0,
+        "confidence_sum": 0.0,
+    }
+
+
+def _tally(bucket: dict, v: dict) -> None:
+    """Add one violation to a stats bucket."""
+    bucket["by_type"][v["detection_type"].value] += 1
+    bucket["by_severity"][v["severity"].value] += 1
+    confidence = v["confidence_score"]
+    bucket["count"] += 1
+    bucket["confidence_sum"] += confidence
+    # High confidence (95%+) violations
+    if confidence >= 0.95:
+        bucket["high_confidence"] += 1
+    if v["is_false_positive"]:
+        bucket["false_positives"] += 1
+    if v["status"] == IncidentStatus.RESOLVED:
+        bucket["resolved"] += 1
+
+
+def _merge_stats(into: dict, bucket: dict) -> None:
+    """Accumulate ``bucket`` into ``into``."""
+    into["by_type"].update(bucket["by_type"])
+    into["by_severity"].update(bucket["by_severity"])
+    for key in ("count", "high_confidence", "false_positives", "resolved", "confidence_sum"):
+        into[key] += bucket[key]
+
+
+# Stats totals per detection day, kept current by the false-positive handlers
+STATS_BY_DAY: Dict[date, dict] = defaultdict(_new_stats_bucket)
+for _violation in DEMO_VIOLATIONS:
+    _tally(STATS_BY_DAY[_violation["detected_at"].date()], _violation)
+
+
+def _get_violation_or_404(violation_id: str) -> dict:
+    """Look up a violation by id, raising 404 if it does not exist."""
+    violation = DEMO_VIOLATIONS_BY_ID.get(violation_id)
+    if violation is None:
+        raise HTTPException(status_code=404, detail="Violation not found")
+    return violation
+
+
+def _search_matches(search: ForensicsSearchRequest) -> Iterator[dict]:
+    """Lazily yield the violations matching ``search`` in ``search.sort_order``."""
+    # Narrow candidates by intersecting the posting lists of the equality filters
+    candidate_ids: Optional[Set[str]] = None
+    for values, index in (
+        (search.site_ids, INDEX_BY_SITE),
+        (search.zone_ids, INDEX_BY_ZONE),
+        (search.camera_ids, INDEX_BY_CAMERA),
+        (search.detection_types, INDEX_BY_DETECTION_TYPE),
+        (search.severities, INDEX_BY_SEVERITY),
+        (search.statuses, INDEX_BY_STATUS),
+    ):
+        if values:
+            matching = set().union(*(index.get(value, ()) for value in values))
+            candidate_ids = matching if candidate_ids is None else candidate_ids & matching
+    
+    # Bound the date range on the newest-first view; results come out already sorted
+    lo = bisect_left(SORTED_DESC_KEYS, -search.end_date.timestamp()) if search.end_date else 0
+    hi = bisect_right(SORTED_DESC_KEYS, -search.start_date.timestamp()) if search.start_date else len(SORTED_DESC_KEYS)
+    hi = max(hi, lo)  # an inverted range selects nothing
+    
+    # Evaluate the column predicates as one boolean mask over the date window
+    if candidate_ids is None:
+        mask = np.ones(hi - lo, dtype=bool)
+    else:
+        in_candidates = np.zeros(len(SORTED_DESC), dtype=bool)
+        in_candidates[[SORTED_DESC_RANK[vid] for vid in candidate_ids]] = True
+        mask = in_candidates[lo:hi]
+    if not search.include_false_positives:
+        mask &= ~SORTED_FALSE_POSITIVE[lo:hi]
+    if search.min_confidence:
+        mask &= SORTED_CONFIDENCE[lo:hi] >= search.min_confidence
+    if search.max_confidence:
+        mask &= SORTED_CONFIDENCE[lo:hi] <= search.max_confidence
+    
+    ranks = np.flatnonzero(mask) + lo
+    if search.sort_order == "asc":
+        selected = np.zeros(len(SORTED_DESC), dtype=bool)
+        selected[ranks] = True
+        ranks = SORTED_ASC_RANKS[selected[SORTED_ASC_RANKS]]
+    
+    # Text search runs lazily on the surviving rows only
+    search_lower = search.search_text.lower() if search.search_text else None
+    return (
+        v for v in (SORTED_DESC[rank] for rank in ranks.tolist())
+        if search_lower is None or search_lower in v.get("description", "").lower()
+    )
 
 
 @router.post("/search", response_model=ForensicsSearchResponse)
@@ -103,54 +261,59 @@ async def search_forensics(
     current_user: dict = Depends(get_current_user)
 ):
     """Search violations with advanced filters and pagination."""
-    filtered = DEMO_VIOLATIONS.copy()
-    
-    # Apply filters
-    if search.start_date:
-        filtered = [v for v in filtered if datetime.fromisoformat(v["detected_at"]) >= search.start_date]
-    if search.end_date:
-        filtered = [v for v in filtered if datetime.fromisoformat(v["detected_at"]) <= search.end_date]
-    if search.site_ids:
-        filtered = [v for v in filtered if v["site_id"] in search.site_ids]
-    if search.zone_ids:
-        filtered = [v for v in filtered if v["zone_id"] in search.zone_ids]
-    if search.camera_ids:
-        filtered = [v for v in filtered if v["camera_id"] in search.camera_ids]
-    if search.detection_types:
-        filtered = [v for v in filtered if v["detection_type"] in search.detection_types]
-    if search.severities:
-        filtered = [v for v in filtered if v["severity"] in search.severities]
-    if search.statuses:
-        filtered = [v for v in filtered if v["status"] in search.statuses]
-    if search.min_confidence:
-        filtered = [v for v in filtered if v["confidence_score"] >= search.min_confidence]
-    if search.max_confidence:
-        filtered = [v for v in filtered if v["confidence_score"] <= search.max_confidence]
-    if not search.include_false_positives:
-        filtered = [v for v in filtered if not v["is_false_positive"]]
-    if search.search_text:
-        search_lower = search.search_text.lower()
-        filtered = [v for v in filtered if search_lower in v.get("description", "").lower()]
-    
-    # Sort by date (newest first)
-    filtered.sort(key=lambda x: x["detected_at"], reverse=True)
+    matches = _search_matches(search)
     
-    # Pagination
-    total = len(filtered)
+    # Pagination: only the requested page is materialized, the rest is counted
+    skipped = sum(1 for _ in islice(matches, (page - 1) * page_size))
+    items = [fast_from_orm(ViolationResponse, v) for v in islice(matches, page_size)]
+    total = skipped + len(items) + sum(1 for _ in matches)
     total_pages = (total + page_size - 1) // page_size
-    start = (page - 1) * page_size
-    end = start + page_size
-    items = filtered[start:end]
     
-    return ForensicsSearchResponse(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
-        has_next=page < total_pages,
-        has_previous=page > 1
+    # Serialized here in one pass rather than dumped and re-validated by FastAPI
+    return ORJSONResponse({
+        "items": VIOLATION_LIST_ADAPTER.dump_python(items, mode="json"),
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+        "has_next": page < total_pages,
+        "has_previous": page > 1
+    })
+
+
+@router.post("/stream")
+async def stream_forensics(
+    search: ForensicsSearchRequest = Body(...),
+    current_user: dict = Depends(get_current_user)
+):
+    """Stream every matching violation as NDJSON, one ViolationResponse per line."""
+    serializer = ViolationResponse.__pydantic_serializer__
+    # Rows are built and serialized one at a time; the full result is never held
+    rows = (
+        serializer.to_json(fast_from_orm(ViolationResponse, v)) + b"\n"
+        for v in _search_matches(search)
     )
+    return StreamingResponse(rows, media_type="application/x-ndjson")
+
+
+@router.post("/frames")
+async def upload_frame(
+    frame: UploadFile = File(...),
+    current_user: dict = Depends(get_current_user)
+):
+    """Upload a violation frame; pass the returned frame_url in ViolationCreate."""
+    if not (frame.content_type or "").startswith("image"):
+        raise HTTPException(status_code=400, detail="Unsupported file type. Please upload an image.")
+    frame_id = f"FRM-{secrets.token_hex(5).upper()}"
+    extension = os.path.splitext(frame.filename or "")[1] or ".jpg"
+    # In production, stream frame.file to object storage (S3) here; the bytes
+    # never pass through pydantic or get copied into a model
+    frame.file.seek(0, os.SEEK_END)
+    file_size = frame.file.tell()
+    return {
+        "frame_url": f"/media/frames/{frame_id}{extension}",
+        "file_size_bytes": file_size
+    }
 
 
 @router.get("/{violation_id}", response_model=ViolationResponse)
@@ -159,10 +322,16 @@ async def get_violation(
     current_user: dict = Depends(get_current_user)
 ):
     """Get a specific violation with all details."""
-    for violation in DEMO_VIOLATIONS:
-        if violation["id"] == violation_id:
-            return violation
-    raise HTTPException(status_code=404, detail="Violation not found")
+    return _get_violation_or_404(violation_id)
+
+
+@router.get("/{violation_id}/comments", response_model=List[ViolationComment])
+async def list_comments(
+    violation_id: str,
+    current_user: dict = Depends(get_current_user)
+):
+    """List a violation's comments with their acknowledgement state."""
+    return _get_violation_or_404(violation_id)["comments"]
 
 
 @router.post("/{violation_id}/comments", response_model=ViolationComment)
@@ -172,23 +341,23 @@ async def add_comment(
     current_user: dict = Depends(get_current_user)
 ):
     """Add a comment to a violation."""
-    for violation in DEMO_VIOLATIONS:
-        if violation["id"] == violation_id:
-            new_comment = {
-                "id": f"CMT-{''.join(random.choices(string.ascii_uppercase + string.digits, k=8))}",
-                "violation_id": violation_id,
-                "user_id": current_user["user_id"],
-                "user_name": current_user.get("email", "User"),
-                "content": comment.content,
-                "created_at": datetime.now().isoformat(),
-                "acknowledged": False,
-                "acknowledged_by": None,
-                "acknowledged_at": None
-            }
-            violation["comments"].append(new_comment)
-            violation["comment_count"] = len(violation["comments"])
-            return new_comment
-    raise HTTPException(status_code=404, detail="Violation not found")
+    violation = _get_violation_or_404(violation_id)
+    now = datetime.now()
+    new_comment = {
+        "id": f"CMT-{secrets.token_hex(4).upper()}",
+        "violation_id": violation_id,
+        "user_id": current_user["user_id"],
+        "user_name": current_user.get("email", "User"),
+        "content": comment.content,
+        "created_at": now,
+        "acknowledged": False,
+        "acknowledged_by": None,
+        "acknowledged_at": None
+    }
+    violation["comments"].append(new_comment)
+    violation["comment_count"] = len(violation["comments"])
+    COMMENTS_BY_ID[new_comment["id"]] = new_comment
+    return new_comment
 
 
 @router.post("/{violation_id}/comments/{comment_id}/acknowledge")
@@ -198,16 +367,14 @@ async def acknowledge_comment(
     current_user: dict = Depends(get_current_user)
 ):
     """Acknowledge a comment."""
-    for violation in DEMO_VIOLATIONS:
-        if violation["id"] == violation_id:
-            for comment in violation["comments"]:
-                if comment["id"] == comment_id:
-                    comment["acknowledged"] = True
-                    comment["acknowledged_by"] = current_user.get("email", "User")
-                    comment["acknowledged_at"] = datetime.now().isoformat()
-                    return {"message": "Comment acknowledged", "comment": comment}
-            raise HTTPException(status_code=404, detail="Comment not found")
-    raise HTTPException(status_code=404, detail="Violation not found")
+    _get_violation_or_404(violation_id)
+    comment = COMMENTS_BY_ID.get(comment_id)
+    if comment is None or comment["violation_id"] != violation_id:
+        raise HTTPException(status_code=404, detail="Comment not found")
+    comment["acknowledged"] = True
+    comment["acknowledged_by"] = current_user.get("email", "User")
+    comment["acknowledged_at"] = datetime.now()
+    return {"message": "Comment acknowledged", "comment": comment}
 
 
 @router.post("/{violation_id}/false-positive")
@@ -217,13 +384,14 @@ async def mark_false_positive(
     current_user: dict = Depends(get_current_user)
 ):
     """Mark a violation as false positive."""
-    for violation in DEMO_VIOLATIONS:
-        if violation["id"] == violation_id:
-            violation["is_false_positive"] = True
-            violation["false_positive_reason"] = request.reason
-            violation["false_positive_marked_by"] = current_user.get("email", "User")
-            return {"message": "Marked as false positive", "violation_id": violation_id}
-    raise HTTPException(status_code=404, detail="Violation not found")
+    violation = _get_violation_or_404(violation_id)
+    if not violation["is_false_positive"]:
+        STATS_BY_DAY[violation["detected_at"].date()]["false_positives"] += 1
+    violation["is_false_positive"] = True
+    SORTED_FALSE_POSITIVE[SORTED_DESC_RANK[violation_id]] = True
+    violation["false_positive_reason"] = request.reason
+    violation["false_positive_marked_by"] = current_user.get("email", "User")
+    return {"message": "Marked as false positive", "violation_id": violation_id}
 
 
 @router.delete("/{violation_id}/false-positive")
@@ -232,13 +400,14 @@ async def unmark_false_positive(
     current_user: dict = Depends(get_current_user)
 ):
     """Remove false positive mark from a violation."""
-    for violation in DEMO_VIOLATIONS:
-        if violation["id"] == violation_id:
-            violation["is_false_positive"] = False
-            violation["false_positive_reason"] = None
-            violation["false_positive_marked_by"] = None
-            return {"message": "False positive mark removed", "violation_id": violation_id}
-    raise HTTPException(status_code=404, detail="Violation not found")
+    violation = _get_violation_or_404(violation_id)
+    if violation["is_false_positive"]:
+        STATS_BY_DAY[violation["detected_at"].date()]["false_positives"] -= 1
+    violation["is_false_positive"] = False
+    SORTED_FALSE_POSITIVE[SORTED_DESC_RANK[violation_id]] = False
+    violation["false_positive_reason"] = None
+    violation["false_positive_marked_by"] = None
+    return {"message": "False positive mark removed", "violation_id": violation_id}
 
 
 @router.get("/{violation_id}/evidence/{evidence_id}/download")
@@ -266,30 +435,28 @@ async def get_forensics_stats(
 ):
     """Get forensics statistics summary."""
     cutoff = datetime.now() - timedelta(days=days)
-    recent = [v for v in DEMO_VIOLATIONS if datetime.fromisoformat(v["detected_at"]) >= cutoff]
+    cutoff_day = cutoff.date()
+    next_midnight = datetime.combine(cutoff_day + timedelta(days=1), time.min)
+    totals = _new_stats_bucket()
     
-    # Count by detection type
-    by_type = {}
-    for v in recent:
-        dt = v["detection_type"].value if hasattr(v["detection_type"], 'value') else v["detection_type"]
-        by_type[dt] = by_type.get(dt, 0) + 1
-    
-    # Count by severity
-    by_severity = {}
-    for v in recent:
-        sev = v["severity"].value if hasattr(v["severity"], 'value') else v["severity"]
-        by_severity[sev] = by_severity.get(sev, 0) + 1
-    
-    # High confidence (95%+) violations
-    high_confidence = len([v for v in recent if v["confidence_score"] >= 0.95])
+    # The cutoff day is only partly inside the window: tally its violations directly
+    lo = bisect_right(SORTED_DESC_KEYS, -next_midnight.timestamp())
+    hi = bisect_right(SORTED_DESC_KEYS, -cutoff.timestamp())
+    for v in SORTED_DESC[lo:hi]:
+        _tally(totals, v)
+    # Every later day is fully inside: merge its precomputed bucket
+    for day, bucket in STATS_BY_DAY.items():
+        if day > cutoff_day:
+            _merge_stats(totals, bucket)
     
+    total = totals["count"]
     return {
-        "total_violations": len(recent),
-        "by_detection_type": by_type,
-        "by_severity": by_severity,
-        "high_confidence_count": high_confidence,
-        "high_confidence_percentage": round(high_confidence / max(len(recent), 1) * 100, 1),
-        "false_positive_count": len([v for v in recent if v["is_false_positive"]]),
-        "resolved_count": len([v for v in recent if v["status"] == IncidentStatus.RESOLVED or v["status"] == "resolved"]),
-        "average_confidence": round(sum(v["confidence_score"] for v in recent) / max(len(recent), 1), 3)
+        "total_violations": total,
+        "by_detection_type": dict(totals["by_type"]),
+        "by_severity": dict(totals["by_severity"]),
+        "high_confidence_count": totals["high_confidence"],
+        "high_confidence_percentage": round(totals["high_confidence"] / max(total, 1) * 100, 1),
+        "false_positive_count": totals["false_positives"],
+        "resolved_count": totals["resolved"],
+        "average_confidence": round(totals["confidence_sum"] / max(total, 1), 3)
     }
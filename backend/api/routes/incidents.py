@@ -1,5 +1,6 @@
 """Incidents management routes."""
-from typing import List, Optional
+from collections import Counter
+from typing import Dict, List, Optional
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, Query, Depends
 from models.schemas import (
@@ -32,6 +33,10 @@ DEMO_INCIDENTS = [
 ]
 
 
+# Id index kept in sync with DEMO_INCIDENTS by create_incident
+DEMO_INCIDENTS_BY_ID: Dict[str, dict] = {i["id"]: i for i in DEMO_INCIDENTS}
+
+
 @router.get("", response_model=List[IncidentResponse])
 async def list_incidents(
     site_id: Optional[str] = Query(None),
@@ -65,10 +70,10 @@ async def get_incident(
     current_user: dict = Depends(get_current_user)
 ):
     """Get a specific incident by ID."""
-    for incident in DEMO_INCIDENTS:
-        if incident["id"] == incident_id:
-            return incident
-    raise HTTPException(status_code=404, detail="Incident not found")
+    incident = DEMO_INCIDENTS_BY_ID.get(incident_id)
+    if incident is None:
+        raise HTTPException(status_code=404, detail="Incident not found")
+    return incident
 
 
 @router.post("", response_model=IncidentResponse)
@@ -86,6 +91,7 @@ async def create_incident(
         "resolution_notes": None
     }
     DEMO_INCIDENTS.append(new_incident)
+    DEMO_INCIDENTS_BY_ID[new_incident["id"]] = new_incident
     return new_incident
 
 
@@ -96,18 +102,18 @@ async def update_incident(
     current_user: dict = Depends(get_current_user)
 ):
     """Update an incident."""
-    for i, incident in enumerate(DEMO_INCIDENTS):
-        if incident["id"] == incident_id:
-            if update.status:
-                DEMO_INCIDENTS[i]["status"] = update.status
-                if update.status == IncidentStatus.RESOLVED:
-                    DEMO_INCIDENTS[i]["resolved_at"] = datetime.now()
-            if update.severity:
-                DEMO_INCIDENTS[i]["severity"] = update.severity
-            if update.resolution_notes:
-                DEMO_INCIDENTS[i]["resolution_notes"] = update.resolution_notes
-            return DEMO_INCIDENTS[i]
-    raise HTTPException(status_code=404, detail="Incident not found")
+    incident = DEMO_INCIDENTS_BY_ID.get(incident_id)
+    if incident is None:
+        raise HTTPException(status_code=404, detail="Incident not found")
+    if update.status:
+        incident["status"] = update.status
+        if update.status == IncidentStatus.RESOLVED:
+            incident["resolved_at"] = datetime.now()
+    if update.severity:
+        incident["severity"] = update.severity
+    if update.resolution_notes:
+        incident["resolution_notes"] = update.resolution_notes
+    return incident
 
 
 @router.get("/summary/counts")
@@ -117,14 +123,16 @@ async def get_incident_summary(
     current_user: dict = Depends(get_current_user)
 ):
     """Get incident summary counts."""
+    by_status = Counter(i["status"] for i in DEMO_INCIDENTS)
+    by_severity = Counter(i["severity"] for i in DEMO_INCIDENTS)
     return {
         "total": len(DEMO_INCIDENTS),
-        "open": len([i for i in DEMO_INCIDENTS if i["status"] == IncidentStatus.OPEN]),
-        "resolved": len([i for i in DEMO_INCIDENTS if i["status"] == IncidentStatus.RESOLVED]),
+        "open": by_status[IncidentStatus.OPEN],
+        "resolved": by_status[IncidentStatus.RESOLVED],
         "by_severity": {
-            "critical": len([i for i in DEMO_INCIDENTS if i["severity"] == IncidentSeverity.CRITICAL]),
-            "high": len([i for i in DEMO_INCIDENTS if i["severity"] == IncidentSeverity.HIGH]),
-            "medium": len([i for i in DEMO_INCIDENTS if i["severity"] == IncidentSeverity.MEDIUM]),
-            "low": len([i for i in DEMO_INCIDENTS if i["severity"] == IncidentSeverity.LOW])
+            "critical": by_severity[IncidentSeverity.CRITICAL],
+            "high": by_severity[IncidentSeverity.HIGH],
+            "medium": by_severity[IncidentSeverity.MEDIUM],
+            "low": by_severity[IncidentSeverity.LOW]
         }
     }
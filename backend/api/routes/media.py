@@ -1,13 +1,15 @@
 """Media upload and management API routes."""
-from typing import List, Optional
+import os
+from typing import Dict, List, Optional
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Query, Depends, UploadFile, File, Form
-import random
-import string
+from itertools import islice
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Depends, UploadFile, File, Form
+from fastapi.responses import ORJSONResponse
+import secrets
 
 from models.schemas import (
     MediaUploadRequest, MediaUploadResponse, MediaListResponse,
-    MediaType, MediaPurpose, DetectionType
+    MediaType, MediaPurpose, DetectionType, MEDIA_LIST_ADAPTER, fast_from_orm
 )
 from core.security import get_current_user
 
@@ -16,6 +18,7 @@ router = APIRouter()
 
 # Demo media storage
 DEMO_MEDIA = []
+DEMO_MEDIA_BY_ID: Dict[str, dict] = {}
 
 
 @router.post("/upload", response_model=MediaUploadResponse)
@@ -39,8 +42,10 @@ async def upload_media(
     else:
         raise HTTPException(status_code=400, detail="Unsupported file type. Please upload an image or video.")
     
+    now = datetime.now()
+    
     # Generate unique ID
-    media_id = f"MED-{''.join(random.choices(string.ascii_uppercase + string.digits, k=10))}"
+    media_id = f"MED-{secrets.token_hex(5).upper()}"
     
     # In production, you would:
     # 1. Save the file to edge storage or cloud (S3)
@@ -48,23 +53,25 @@ async def upload_media(
     # 3. Generate thumbnail
     # 4. Queue for AI analysis if needed
     
-    # Read file size
-    file_content = await file.read()
-    file_size = len(file_content)
+    # Size the spooled upload by seeking to its end instead of reading it into memory
+    file.file.seek(0, os.SEEK_END)
+    file_size = file.file.tell()
+    await file.seek(0)
+    extension = os.path.splitext(file.filename)[1]
     
     # Create media record
     media_record = {
         "id": media_id,
         "filename": file.filename,
-        "original_url": f"/media/uploads/{media_id}_original.{file.filename.split('.')[-1]}",
-        "blurred_url": f"/media/uploads/{media_id}_blurred.{file.filename.split('.')[-1]}",
+        "original_url": f"/media/uploads/{media_id}_original{extension}",
+        "blurred_url": f"/media/uploads/{media_id}_blurred{extension}",
         "thumbnail_url": f"/media/uploads/{media_id}_thumb.jpg",
         "media_type": media_type,
         "purpose": purpose,
         "file_size_bytes": file_size,
         "duration_seconds": 12.5 if media_type == MediaType.VIDEO else None,
         "uploaded_by": current_user.get("email", "User"),
-        "uploaded_at": datetime.now().isoformat(),
+        "uploaded_at": now,
         "analysis_status": "pending",
         "analysis_results": None,
         "site_id": site_id,
@@ -74,8 +81,9 @@ async def upload_media(
     }
     
     DEMO_MEDIA.append(media_record)
+    DEMO_MEDIA_BY_ID[media_id] = media_record
     
-    return MediaUploadResponse(**media_record)
+    return fast_from_orm(MediaUploadResponse, media_record)
 
 
 @router.get("", response_model=MediaListResponse)
@@ -87,25 +95,24 @@ async def list_media(
     current_user: dict = Depends(get_current_user)
 ):
     """List uploaded media with filters."""
-    filtered = DEMO_MEDIA.copy()
-    
-    if purpose:
-        filtered = [m for m in filtered if m["purpose"] == purpose]
-    if media_type:
-        filtered = [m for m in filtered if m["media_type"] == media_type]
+    matches = (
+        m for m in DEMO_MEDIA
+        if (not purpose or m["purpose"] == purpose)
+        and (not media_type or m["media_type"] == media_type)
+    )
     
-    # Pagination
-    total = len(filtered)
-    start = (page - 1) * page_size
-    end = start + page_size
-    items = filtered[start:end]
+    # Pagination: only the requested page is materialized, the rest is counted
+    skipped = sum(1 for _ in islice(matches, (page - 1) * page_size))
+    items = [fast_from_orm(MediaUploadResponse, m) for m in islice(matches, page_size)]
+    total = skipped + len(items) + sum(1 for _ in matches)
     
-    return MediaListResponse(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size
-    )
+    # Serialized here in one pass rather than dumped and re-validated by FastAPI
+    return ORJSONResponse({
+        "items": MEDIA_LIST_ADAPTER.dump_python(items, mode="json"),
+        "total": total,
+        "page": page,
+        "page_size": page_size
+    })
 
 
 @router.get("/{media_id}", response_model=MediaUploadResponse)
@@ -114,35 +121,44 @@ async def get_media(
     current_user: dict = Depends(get_current_user)
 ):
     """Get media details."""
-    for media in DEMO_MEDIA:
-        if media["id"] == media_id:
-            return media
-    raise HTTPException(status_code=404, detail="Media not found")
+    media = DEMO_MEDIA_BY_ID.get(media_id)
+    if media is None:
+        raise HTTPException(status_code=404, detail="Media not found")
+    return media
+
+
+def _run_analysis(media_id: str) -> None:
+    """Run AI analysis for a media record (simulated)."""
+    media = DEMO_MEDIA_BY_ID.get(media_id)
+    if media is None:
+        # Deleted before the task ran
+        return
+    # In production, hand this to a task queue (Celery/arq) instead of the web worker
+    media["analysis_results"] = {
+        "detections": [
+            {"type": "person", "confidence": 0.96, "bbox": [100, 50, 200, 350]},
+            {"type": "no_hardhat", "confidence": 0.92, "bbox": [120, 50, 180, 100]}
+        ],
+        "safety_score": 65,
+        "violations_found": 1,
+        "processed_at": datetime.now()
+    }
+    media["analysis_status"] = "completed"
 
 
 @router.post("/{media_id}/analyze")
 async def analyze_media(
     media_id: str,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(get_current_user)
 ):
-    """Trigger AI analysis on uploaded media."""
-    for media in DEMO_MEDIA:
-        if media["id"] == media_id:
-            media["analysis_status"] = "processing"
-            # In production, queue this for AI processing
-            # Simulate analysis results
-            media["analysis_results"] = {
-                "detections": [
-                    {"type": "person", "confidence": 0.96, "bbox": [100, 50, 200, 350]},
-                    {"type": "no_hardhat", "confidence": 0.92, "bbox": [120, 50, 180, 100]}
-                ],
-                "safety_score": 65,
-                "violations_found": 1,
-                "processed_at": datetime.now().isoformat()
-            }
-            media["analysis_status"] = "completed"
-            return {"message": "Analysis complete", "results": media["analysis_results"]}
-    raise HTTPException(status_code=404, detail="Media not found")
+    """Queue AI analysis on uploaded media; poll the media record for results."""
+    media = DEMO_MEDIA_BY_ID.get(media_id)
+    if media is None:
+        raise HTTPException(status_code=404, detail="Media not found")
+    media["analysis_status"] = "processing"
+    background_tasks.add_task(_run_analysis, media_id)
+    return {"message": "Analysis queued", "media_id": media_id, "status": "processing"}
 
 
 @router.delete("/{media_id}")
@@ -151,12 +167,10 @@ async def delete_media(
     current_user: dict = Depends(get_current_user)
 ):
     """Delete uploaded media."""
-    global DEMO_MEDIA
-    original_len = len(DEMO_MEDIA)
-    DEMO_MEDIA = [m for m in DEMO_MEDIA if m["id"] != media_id]
-    
-    if len(DEMO_MEDIA) == original_len:
+    media = DEMO_MEDIA_BY_ID.pop(media_id, None)
+    if media is None:
         raise HTTPException(status_code=404, detail="Media not found")
+    DEMO_MEDIA.remove(media)
     
     return {"message": "Media deleted", "media_id": media_id}
 
@@ -168,16 +182,16 @@ async def download_media(
     current_user: dict = Depends(get_current_user)
 ):
     """Download media file."""
-    for media in DEMO_MEDIA:
-        if media["id"] == media_id:
-            url = media["blurred_url"] if blurred else media["original_url"]
-            return {
-                "message": "Download ready",
-                "download_url": url,
-                "filename": media["filename"],
-                "blurred": blurred
-            }
-    raise HTTPException(status_code=404, detail="Media not found")
+    media = DEMO_MEDIA_BY_ID.get(media_id)
+    if media is None:
+        raise HTTPException(status_code=404, detail="Media not found")
+    url = media["blurred_url"] if blurred else media["original_url"]
+    return {
+        "message": "Download ready",
+        "download_url": url,
+        "filename": media["filename"],
+        "blurred": blurred
+    }
 
 
 @router.get("/training/datasets")
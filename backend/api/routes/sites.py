@@ -1,49 +1,99 @@
 """Site/Location management routes."""
+import hashlib
 from typing import List, Optional
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response
+from fastapi_cache.decorator import cache
+from pydantic import TypeAdapter
 from models.schemas import SiteCreate, SiteResponse, ZoneCreate, ZoneResponse
 from core.security import get_current_user
+from core import clock
 
 router = APIRouter()
 
+# Site summaries are polled by dashboards but change at most once a minute
+SITE_SUMMARY_CACHE_EXPIRE = 60
+# Site and zone listings are static; let clients revalidate with If-None-Match
+SITE_CACHE_CONTROL = "max-age=30"
+
+
+def _site_summary_key_builder(
+    func,
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: tuple = (),
+    kwargs: Optional[dict] = None
+) -> str:
+    """Key site summaries by site only; the payload does not depend on the caller."""
+    return f"{namespace}:site-summary:{(kwargs or {}).get('site_id')}"
+
+
+def _etag(body: bytes) -> str:
+    """Strong ETag for a serialized response body."""
+    return f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def _json_response(request: Request, body: bytes, etag: Optional[str] = None) -> Response:
+    """Return a JSON body with its ETag, or 304 if the client already has it."""
+    etag = etag or _etag(body)
+    headers = {"ETag": etag, "Cache-Control": SITE_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+# Static demo content, built once at import instead of per request
+_CREATED_AT = datetime.now()
+_SITE_TEMPLATE = {
+    "name": "Main Construction Site",
+    "address": "123 Industrial Ave, City, State 12345",
+    "timezone": "America/New_York",
+    "organization_id": "org-001",
+    "is_active": True,
+    "camera_count": 5,
+    "created_at": _CREATED_AT,
+}
+
+# Serializers for the list endpoints, built once and reused
+_SITES_ADAPTER = TypeAdapter(List[SiteResponse])
+_ZONES_ADAPTER = TypeAdapter(List[ZoneResponse])
+_SITES_BODY = _SITES_ADAPTER.dump_json([SiteResponse(id="site-001", **_SITE_TEMPLATE)])
+_SITES_ETAG = _etag(_SITES_BODY)
+# Validated zone; site_id is filled in per request
+_ZONE_TEMPLATE = ZoneResponse(
+    id="zone-001",
+    name="Heavy Equipment Area",
+    zone_type="exclusion",
+    polygon_coordinates=[100, 100, 400, 100, 400, 300, 100, 300],
+    max_allowed=0,
+    site_id="",
+    camera_id="cam-001",
+    is_active=True
+)
+
 
 @router.get("", response_model=List[SiteResponse])
 async def list_sites(
+    request: Request,
     organization_id: Optional[str] = Query(None),
     current_user: dict = Depends(get_current_user)
 ):
     """List all sites."""
-    return [
-        SiteResponse(
-            id="site-001",
-            name="Main Construction Site",
-            address="123 Industrial Ave, City, State 12345",
-            timezone="America/New_York",
-            organization_id="org-001",
-            is_active=True,
-            camera_count=5,
-            created_at=datetime.now()
-        )
-    ]
+    # Already serialized at import; returning a response skips re-validation
+    return _json_response(request, _SITES_BODY, _SITES_ETAG)
 
 
 @router.get("/{site_id}", response_model=SiteResponse)
 async def get_site(
     site_id: str,
+    request: Request,
     current_user: dict = Depends(get_current_user)
 ):
     """Get a specific site by ID."""
-    return SiteResponse(
-        id=site_id,
-        name="Main Construction Site",
-        address="123 Industrial Ave, City, State 12345",
-        timezone="America/New_York",
-        organization_id="org-001",
-        is_active=True,
-        camera_count=5,
-        created_at=datetime.now()
-    )
+    site = SiteResponse.model_construct(id=site_id, **_SITE_TEMPLATE)
+    return _json_response(request, site.model_dump_json().encode())
 
 
 @router.post("", response_model=SiteResponse)
@@ -52,7 +102,8 @@ async def create_site(
     current_user: dict = Depends(get_current_user)
 ):
     """Create a new site."""
-    return SiteResponse(
+    # Fields come from an already-validated SiteCreate
+    return SiteResponse.model_construct(
         id="site-new",
         name=site.name,
         address=site.address,
@@ -60,33 +111,19 @@ async def create_site(
         organization_id=site.organization_id,
         is_active=True,
         camera_count=0,
-        created_at=datetime.now()
+        created_at=clock.now()
     )
 
 
 @router.get("/{site_id}/zones", response_model=List[ZoneResponse])
 async def list_zones(
     site_id: str,
+    request: Request,
     current_user: dict = Depends(get_current_user)
 ):
     """List all zones for a site."""
-    return [
-        ZoneResponse(
-            id="zone-001",
-            name="Heavy Equipment Area",
-            zone_type="exclusion",
-            polygon_coordinates=[
-                {"x": 100, "y": 100},
-                {"x": 400, "y": 100},
-                {"x": 400, "y": 300},
-                {"x": 100, "y": 300}
-            ],
-            max_allowed=0,
-            site_id=site_id,
-            camera_id="cam-001",
-            is_active=True
-        )
-    ]
+    zone = _ZONE_TEMPLATE.model_copy(update={"site_id": site_id})
+    return _json_response(request, _ZONES_ADAPTER.dump_json([zone]))
 
 
 @router.post("/{site_id}/zones", response_model=ZoneResponse)
@@ -96,7 +133,8 @@ async def create_zone(
     current_user: dict = Depends(get_current_user)
 ):
     """Create a new zone for a site."""
-    return ZoneResponse(
+    # Fields come from an already-validated ZoneCreate
+    return ZoneResponse.model_construct(
         id="zone-new",
         name=zone.name,
         zone_type=zone.zone_type,
@@ -109,6 +147,7 @@ async def create_zone(
 
 
 @router.get("/{site_id}/summary")
+@cache(expire=SITE_SUMMARY_CACHE_EXPIRE, key_builder=_site_summary_key_builder)
 async def get_site_summary(
     site_id: str,
     current_user: dict = Depends(get_current_user)
@@ -0,0 +1,21 @@
+"""Coarse wall clock refreshed once per second."""
+import asyncio
+from datetime import datetime
+
+# Resolution of the cached clock, in seconds
+CLOCK_TICK_SECONDS = 1.0
+
+_now = datetime.now()
+
+
+def now() -> datetime:
+    """Get the current time, accurate to within one tick."""
+    return _now
+
+
+async def tick() -> None:
+    """Refresh the cached time until cancelled."""
+    global _now
+    while True:
+        _now = datetime.now()
+        await asyncio.sleep(CLOCK_TICK_SECONDS)
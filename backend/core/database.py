@@ -0,0 +1,38 @@
+"""Database connection pool management."""
+import asyncpg
+from fastapi import FastAPI, Request
+
+from .config import settings
+
+# One connection kept open from startup so the first request skips the handshake
+DATABASE_POOL_MIN_SIZE = 1
+
+
+async def init_database(app: FastAPI) -> None:
+    """Create the shared asyncpg pool and attach it to the application state.
+    
+    Skipped unless ``DATABASE_ENABLED`` is set, so the demo runs without Postgres.
+    """
+    if not settings.DATABASE_ENABLED:
+        app.state.db_pool = None
+        return
+    app.state.db_pool = await asyncpg.create_pool(
+        dsn=settings.DATABASE_URL.replace("+asyncpg", ""),
+        min_size=DATABASE_POOL_MIN_SIZE,
+        max_size=settings.DATABASE_POOL_SIZE + settings.DATABASE_MAX_OVERFLOW,
+        max_inactive_connection_lifetime=300,
+        command_timeout=60,
+        statement_cache_size=1024,
+    )
+
+
+async def close_database(app: FastAPI) -> None:
+    """Close the shared asyncpg pool."""
+    pool = getattr(app.state, "db_pool", None)
+    if pool is not None:
+        await pool.close()
+
+
+async def get_db(request: Request) -> asyncpg.Pool:
+    """Get the shared database pool."""
+    return request.app.state.db_pool
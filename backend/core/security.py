@@ -1,5 +1,7 @@
 """Security utilities for authentication and authorization."""
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -38,17 +40,31 @@ def create_refresh_token(data: dict) -> str:
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
+@lru_cache(maxsize=10_000)
+def _verify_token_signature(token: str) -> dict:
+    """Verify a JWT signature once per token; expiry is checked by the caller."""
+    return jwt.decode(
+        token,
+        settings.SECRET_KEY,
+        algorithms=[settings.ALGORITHM],
+        options={"verify_exp": False},
+    )
+
+
 def decode_token(token: str) -> dict:
     """Decode and validate JWT token."""
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
+        payload = _verify_token_signature(token)
     except JWTError:
+        payload = None
+    exp = payload.get("exp") if payload else None
+    if payload is None or (exp is not None and exp <= time.time()):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    return dict(payload)
 
 
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> dict:
@@ -1,12 +1,14 @@
 """Data module."""
+from . import demo_data
 from .demo_data import (
     DEMO_USERS,
     DEMO_SITES,
     DEMO_ZONES,
     DEMO_CAMERAS,
-    DEMO_INCIDENTS,
-    DEMO_ALERTS,
     DETECTION_TYPES,
+    DETECTION_TYPES_BY_VALUE,
+    get_demo_incidents,
+    get_demo_alerts,
 )
 
 __all__ = [
@@ -17,4 +19,14 @@ __all__ = [
     "DEMO_INCIDENTS",
     "DEMO_ALERTS",
     "DETECTION_TYPES",
+    "DETECTION_TYPES_BY_VALUE",
+    "get_demo_incidents",
+    "get_demo_alerts",
 ]
+
+
+def __getattr__(name):
+    """Defer DEMO_INCIDENTS/DEMO_ALERTS to demo_data so they are generated on first use."""
+    if name in ("DEMO_INCIDENTS", "DEMO_ALERTS"):
+        return getattr(demo_data, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
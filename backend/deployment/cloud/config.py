@@ -1,11 +1,13 @@
 """AWS Cloud deployment specific configuration."""
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional, List
 
 
 class CloudConfig(BaseSettings):
     """Configuration for AWS cloud deployment."""
     
+    model_config = SettingsConfigDict(env_file=".env.cloud", frozen=True, validate_default=False)
+    
     # AWS Credentials (use IAM roles in production)
     AWS_ACCESS_KEY_ID: Optional[str] = None
     AWS_SECRET_ACCESS_KEY: Optional[str] = None
@@ -58,9 +60,6 @@ class CloudConfig(BaseSettings):
     # Multi-Region
     ENABLE_MULTI_REGION: bool = False
     SECONDARY_REGIONS: List[str] = []
-    
-    class Config:
-        env_file = ".env.cloud"
 
 
 cloud_config = CloudConfig()
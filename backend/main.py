@@ -1,29 +1,34 @@
 """Main FastAPI application entry point."""
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from contextlib import asynccontextmanager
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager, suppress
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from redis import asyncio as aioredis
+import asyncio
+import logging
+import orjson
 import structlog
 
 from core.config import settings
+from core.database import init_database, close_database
+from core import clock
 from api import router as api_router
 
 # Configure structured logging
 structlog.configure(
     processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
+        structlog.processors.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        structlog.processors.JSONRenderer(serializer=orjson.dumps)
     ],
-    wrapper_class=structlog.stdlib.BoundLogger,
+    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
     context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
+    logger_factory=structlog.BytesLoggerFactory(),
     cache_logger_on_first_use=True,
 )
 
@@ -37,19 +42,29 @@ async def lifespan(app: FastAPI):
     logger.info("Starting SafetyVision AI Platform", version=settings.APP_VERSION)
     
     # Initialize database connections, AI models, etc.
-    # await init_database()
+    await init_database(app)
     # await load_ai_models()
+    redis = aioredis.from_url(settings.REDIS_URL)
+    FastAPICache.init(RedisBackend(redis), prefix="iso")
+    clock_task = asyncio.create_task(clock.tick())
+    # Generate the OpenAPI schema now instead of on the first docs request
+    app.openapi()
     
     yield
     
     # Shutdown
     logger.info("Shutting down SafetyVision AI Platform")
-    # await close_database()
+    clock_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await clock_task
+    await close_database(app)
+    await redis.close()
 
 
 # Create FastAPI application
 app = FastAPI(
     title=settings.APP_NAME,
+    default_response_class=ORJSONResponse,
     description="""
     ## SafetyVision AI Platform
     
@@ -71,6 +86,25 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+class VersionPrefixMiddleware:
+    """Rewrite /api/v1/... request paths to /api/... before routing."""
+
+    prefix = "/api/v1"
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket"):
+            path = scope["path"]
+            if path == self.prefix or path.startswith(self.prefix + "/"):
+                scope = dict(scope)
+                scope["path"] = "/api" + path[len(self.prefix):]
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(VersionPrefixMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -92,8 +126,7 @@ async def health_check():
     }
 
 
-# Include API router (both versioned and non-versioned for frontend compatibility)
-app.include_router(api_router, prefix="/api/v1")
+# Include API router once; /api/v1 is served by rewriting it onto /api
 app.include_router(api_router, prefix="/api")
 
 
@@ -102,7 +135,7 @@ app.include_router(api_router, prefix="/api")
 async def global_exception_handler(request, exc):
     """Handle uncaught exceptions."""
     logger.error("Unhandled exception", error=str(exc), path=request.url.path)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "An internal error occurred. Please try again later."}
     )
@@ -115,5 +148,9 @@ if __name__ == "__main__":
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
-        workers=1 if settings.DEBUG else settings.WORKERS
+        workers=1 if settings.DEBUG else settings.WORKERS,
+        loop="uvloop",
+        http="httptools",
+        log_config=None,
+        access_log=False
     )
@@ -1,8 +1,17 @@
 """Pydantic schemas for API request/response models."""
+from collections.abc import Mapping
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, EmailStr, Field
+from functools import lru_cache
+from typing import Annotated, FrozenSet, List, Literal, Optional, Dict, Any, Tuple, Type, TypeVar, get_args, get_origin
+from pydantic import (
+    AfterValidator, BaseModel, ConfigDict, Field, PlainValidator, TypeAdapter, WithJsonSchema,
+    create_model, field_validator
+)
+from pydantic_core import PydanticCustomError
 from enum import Enum
+from typing_extensions import Required, TypedDict
+
+import numpy as np
 
 
 # Enums
@@ -61,11 +70,100 @@ class ViolationType(str, Enum):
     EQUIPMENT_HAZARD = "equipment_hazard"
 
 
+# Value -> member tables, one per enum, built once at import
+_USER_ROLE_BY_VALUE: Dict[str, UserRole] = {m.value: m for m in UserRole}
+_DETECTION_TYPE_BY_VALUE: Dict[str, DetectionType] = {m.value: m for m in DetectionType}
+_MEDIA_TYPE_BY_VALUE: Dict[str, MediaType] = {m.value: m for m in MediaType}
+_MEDIA_PURPOSE_BY_VALUE: Dict[str, MediaPurpose] = {m.value: m for m in MediaPurpose}
+_INCIDENT_SEVERITY_BY_VALUE: Dict[str, IncidentSeverity] = {m.value: m for m in IncidentSeverity}
+_INCIDENT_STATUS_BY_VALUE: Dict[str, IncidentStatus] = {m.value: m for m in IncidentStatus}
+_VIOLATION_TYPE_BY_VALUE: Dict[str, ViolationType] = {m.value: m for m in ViolationType}
+
+
+def _fast_enum(enum_cls: Type[Enum], by_value: Dict[str, Enum]) -> Any:
+    """Annotated enum type validated by a single value -> member dict lookup.
+    
+    Replaces pydantic's str-then-Enum() chain; errors and JSON schema match
+    the plain enum, except that the schema is inlined rather than referenced.
+    Members hash like their values, so already-parsed input is accepted too.
+    """
+    values = [repr(value) for value in by_value]
+    expected = f"{', '.join(values[:-1])} or {values[-1]}" if len(values) > 1 else values[0]
+    
+    def to_member(value: Any) -> Enum:
+        try:
+            return by_value[value]
+        except (KeyError, TypeError):
+            raise PydanticCustomError("enum", "Input should be {expected}", {"expected": expected}) from None
+    
+    return Annotated[enum_cls, PlainValidator(to_member), WithJsonSchema(TypeAdapter(enum_cls).json_schema())]
+
+
+# Enum field types; every enum-valued field in this module uses these
+FastUserRole = _fast_enum(UserRole, _USER_ROLE_BY_VALUE)
+FastDetectionType = _fast_enum(DetectionType, _DETECTION_TYPE_BY_VALUE)
+FastMediaType = _fast_enum(MediaType, _MEDIA_TYPE_BY_VALUE)
+FastMediaPurpose = _fast_enum(MediaPurpose, _MEDIA_PURPOSE_BY_VALUE)
+FastIncidentSeverity = _fast_enum(IncidentSeverity, _INCIDENT_SEVERITY_BY_VALUE)
+FastIncidentStatus = _fast_enum(IncidentStatus, _INCIDENT_STATUS_BY_VALUE)
+FastViolationType = _fast_enum(ViolationType, _VIOLATION_TYPE_BY_VALUE)
+
+
+def make_partial(
+    model: Type[BaseModel],
+    name: str,
+    doc: str,
+    include: Optional[Tuple[str, ...]] = None,
+    validators: Optional[Dict[str, Any]] = None,
+    **extra_fields: Any
+) -> Type[BaseModel]:
+    """Build an update schema from a model's fields, all optional and defaulting to None.
+    
+    ``include`` restricts which of the model's fields are copied; ``extra_fields``
+    maps further field names to their (non-optional) types.
+    """
+    fields = {
+        field_name: (Optional[field.annotation], None)
+        for field_name, field in model.model_fields.items()
+        if include is None or field_name in include
+    }
+    fields.update((field_name, (Optional[annotation], None)) for field_name, annotation in extra_fields.items())
+    return create_model(name, __doc__=doc, __validators__=validators, **fields)
+
+
+_email_validator = None
+
+
+def _lazy_email(value: str) -> str:
+    """Validate and normalize an email address, importing email-validator on first use."""
+    global _email_validator
+    if _email_validator is None:
+        import email_validator
+        _email_validator = email_validator
+    try:
+        return _email_validator.validate_email(value, check_deliverability=False).normalized
+    except _email_validator.EmailNotValidError as e:
+        raise ValueError(f"value is not a valid email address: {e}") from None
+
+
+# Wire-compatible with EmailStr, minus the email-validator import at module load
+LazyEmailStr = Annotated[
+    str,
+    AfterValidator(_lazy_email),
+    WithJsonSchema({"type": "string", "format": "email"})
+]
+
+
+class OrmBase(BaseModel):
+    """Base for response models read from ORM rows; instances are immutable."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
 # User Schemas
 class UserBase(BaseModel):
-    email: EmailStr
+    email: LazyEmailStr
     full_name: str
-    role: UserRole = UserRole.VIEWER
+    role: FastUserRole = UserRole.VIEWER
 
 
 class UserCreate(UserBase):
@@ -73,14 +171,11 @@ class UserCreate(UserBase):
     organization_id: Optional[str] = None
 
 
-class UserResponse(UserBase):
+class UserResponse(UserBase, OrmBase):
     id: str
     organization_id: Optional[str]
     is_active: bool
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 # Organization Schemas
@@ -94,14 +189,11 @@ class OrganizationCreate(OrganizationBase):
     subscription_tier: str = "professional"
 
 
-class OrganizationResponse(OrganizationBase):
+class OrganizationResponse(OrganizationBase, OrmBase):
     id: str
     subscription_tier: str
     is_active: bool
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 # Site/Location Schemas
@@ -115,23 +207,34 @@ class SiteCreate(SiteBase):
     organization_id: str
 
 
-class SiteResponse(SiteBase):
+class SiteResponse(SiteBase, OrmBase):
     id: str
     organization_id: str
     is_active: bool
     camera_count: int = 0
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 # Zone Schemas
+def _check_flat_polygon(v: Optional[List[float]]) -> Optional[List[float]]:
+    """Flat polygons alternate x and y, so they must have an even length."""
+    if v is not None and len(v) % 2:
+        raise ValueError("polygon_coordinates must be flat x, y pairs (x0, y0, x1, y1, ...)")
+    return v
+
+
 class ZoneBase(BaseModel):
     name: str
     zone_type: str  # exclusion, restricted, mandatory_ppe
-    polygon_coordinates: List[Dict[str, float]]
+    polygon_coordinates: List[float]  # flat x0, y0, x1, y1, ...
     max_allowed: int = 0
+    
+    _validate_polygon = field_validator("polygon_coordinates")(_check_flat_polygon)
+    
+    @property
+    def vertices_xy(self) -> np.ndarray:
+        """Polygon vertices as a contiguous (n, 2) float32 array."""
+        return np.asarray(self.polygon_coordinates, dtype=np.float32).reshape(-1, 2)
 
 
 class ZoneCreate(ZoneBase):
@@ -139,14 +242,11 @@ class ZoneCreate(ZoneBase):
     camera_id: str
 
 
-class ZoneResponse(ZoneBase):
+class ZoneResponse(ZoneBase, OrmBase):
     id: str
     site_id: str
     camera_id: str
     is_active: bool
-    
-    class Config:
-        from_attributes = True
 
 
 # Camera Schemas
@@ -161,55 +261,72 @@ class CameraCreate(CameraBase):
     policy_id: Optional[str] = None
 
 
-class CameraResponse(CameraBase):
+class CameraResponse(CameraBase, OrmBase):
     id: str
     site_id: str
     policy_id: Optional[str]
     is_active: bool
     status: str
     last_frame_at: Optional[datetime]
-    
-    class Config:
-        from_attributes = True
 
 
 # Incident Schemas
+class DetectedObject(TypedDict, total=False):
+    """Object detected in a frame."""
+    type: Required[str]
+    confidence: Required[float]
+    bbox: Annotated[List[float], Field(min_length=4, max_length=4)]  # x1, y1, x2, y2
+    track_id: int
+
+
+class BBoxAccessor:
+    """Mixin for schemas carrying ``detected_objects``."""
+    
+    def bboxes_f32(self) -> np.ndarray:
+        """Boxes of the objects that have one, as a contiguous (N, 4) float32 array."""
+        boxes = [obj["bbox"] for obj in self.detected_objects if "bbox" in obj]
+        return np.array(boxes, dtype=np.float32).reshape(-1, 4)
+
+
+class _CoreIncidentFields(BBoxAccessor, OrmBase):
+    """Fields shared by the incident and violation responses."""
+    id: str
+    camera_id: str
+    site_id: str
+    zone_id: Optional[str]
+    status: FastIncidentStatus
+    detected_objects: List[DetectedObject]
+    detected_at: datetime
+    resolved_at: Optional[datetime] = None
+
+
 class IncidentBase(BaseModel):
-    violation_type: ViolationType
-    severity: IncidentSeverity
+    violation_type: FastViolationType
+    severity: FastIncidentSeverity
     description: Optional[str] = None
 
 
-class IncidentCreate(IncidentBase):
+class IncidentCreate(IncidentBase, BBoxAccessor):
     camera_id: str
     site_id: str
     zone_id: Optional[str] = None
-    detected_objects: List[Dict[str, Any]] = []
+    detected_objects: List[DetectedObject] = Field(default_factory=list)
     frame_url: Optional[str] = None
     confidence_score: float
 
 
-class IncidentResponse(IncidentBase):
-    id: str
-    camera_id: str
-    site_id: str
-    zone_id: Optional[str]
-    status: IncidentStatus
-    detected_objects: List[Dict[str, Any]]
+class IncidentResponse(IncidentBase, _CoreIncidentFields):
     frame_url: Optional[str]
     confidence_score: float
-    detected_at: datetime
-    resolved_at: Optional[datetime]
     resolution_notes: Optional[str]
-    
-    class Config:
-        from_attributes = True
 
 
-class IncidentUpdate(BaseModel):
-    status: Optional[IncidentStatus] = None
-    severity: Optional[IncidentSeverity] = None
-    resolution_notes: Optional[str] = None
+IncidentUpdate = make_partial(
+    IncidentResponse,
+    "IncidentUpdate",
+    "Update incident.",
+    include=("status", "severity", "resolution_notes")
+)
 
 
 # Near-Miss Schemas
@@ -218,17 +335,14 @@ class NearMissCreate(BaseModel):
     site_id: str
     near_miss_type: str
     description: Optional[str] = None
-    involved_objects: List[Dict[str, Any]] = []
+    involved_objects: List[Dict[str, Any]] = Field(default_factory=list)
     frame_url: Optional[str] = None
 
 
-class NearMissResponse(NearMissCreate):
+class NearMissResponse(NearMissCreate, OrmBase):
     id: str
     detected_at: datetime
     reviewed: bool = False
-    
-    class Config:
-        from_attributes = True
 
 
 # Analytics Schemas
@@ -239,10 +353,20 @@ class DateRangeFilter(BaseModel):
     camera_ids: Optional[List[str]] = None
 
 
+class SeverityBreakdown(BaseModel):
+    """Incident counts per severity level."""
+    critical: int = 0
+    high: int = 0
+    medium: int = 0
+    low: int = 0
+    
+    model_config = ConfigDict(frozen=True)
+
+
 class IncidentTrendData(BaseModel):
     date: str
     incident_count: int
-    severity_breakdown: Dict[str, int]
+    severity_breakdown: SeverityBreakdown
 
 
 class LocationRiskData(BaseModel):
@@ -263,6 +387,8 @@ class SafetyScoreData(BaseModel):
     predictive_risk_probability: float
     compliance_coverage: float
     trend: str  # improving, stable, declining
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class KPIDashboardData(BaseModel):
@@ -289,16 +415,13 @@ class CorrectiveActionCreate(CorrectiveActionBase):
     incident_id: str
 
 
-class CorrectiveActionResponse(CorrectiveActionBase):
+class CorrectiveActionResponse(CorrectiveActionBase, OrmBase):
     id: str
     incident_id: str
     status: str
     created_at: datetime
     completed_at: Optional[datetime]
     effectiveness_score: Optional[float]
-    
-    class Config:
-        from_attributes = True
 
 
 # Report Schemas
@@ -318,6 +441,8 @@ class ReportResponse(BaseModel):
     download_url: Optional[str]
     created_at: datetime
     completed_at: Optional[datetime]
+    
+    model_config = ConfigDict(frozen=True)
 
 
 # Authentication Schemas
@@ -325,10 +450,12 @@ class TokenResponse(BaseModel):
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class LoginRequest(BaseModel):
-    email: EmailStr
+    email: LazyEmailStr
     password: str
 
 
@@ -349,6 +476,14 @@ class ViolationComment(BaseModel):
     acknowledged_at: Optional[datetime] = None
 
 
+class ViolationCommentSummary(BaseModel):
+    """Comment as embedded in violation responses; see ViolationComment for the full record."""
+    id: str
+    user_name: str
+    content: str
+    created_at: datetime
+
+
 class ViolationCommentCreate(BaseModel):
     """Create a new comment."""
     content: str
@@ -358,7 +493,7 @@ class ViolationEvidence(BaseModel):
     """Evidence attached to a violation."""
     id: str
     violation_id: str
-    media_type: MediaType
+    media_type: FastMediaType
     original_url: str  # Original high-res
     blurred_url: str  # Face-blurred version
     thumbnail_url: Optional[str] = None
@@ -369,51 +504,42 @@ class ViolationEvidence(BaseModel):
 
 class ViolationBase(BaseModel):
     """Base violation model."""
-    detection_type: DetectionType
-    severity: IncidentSeverity
+    detection_type: FastDetectionType
+    severity: FastIncidentSeverity
     confidence_score: float = Field(..., ge=0.0, le=1.0, description="Detection confidence (0-1)")
     description: Optional[str] = None
 
 
-class ViolationCreate(ViolationBase):
+class ViolationCreate(ViolationBase, BBoxAccessor):
     """Create a new violation."""
     camera_id: str
     site_id: str
     zone_id: Optional[str] = None
-    detected_objects: List[Dict[str, Any]] = []
-    frame_data: Optional[str] = None  # Base64 encoded frame
+    detected_objects: List[DetectedObject] = Field(default_factory=list)
+    frame_url: Optional[str] = None  # Returned by POST /forensics/frames
 
 
-class ViolationResponse(ViolationBase):
+class ViolationResponse(ViolationBase, _CoreIncidentFields):
     """Full violation response."""
-    id: str
-    camera_id: str
     camera_name: str
-    site_id: str
     site_name: str
-    zone_id: Optional[str]
     zone_name: Optional[str]
-    status: IncidentStatus
     is_false_positive: bool = False
     false_positive_reason: Optional[str] = None
     false_positive_marked_by: Optional[str] = None
-    detected_objects: List[Dict[str, Any]]
-    evidence: List[ViolationEvidence] = []
-    comments: List[ViolationComment] = []
+    evidence: List[ViolationEvidence] = Field(default_factory=list)
+    comments: List[ViolationCommentSummary] = Field(default_factory=list)
     comment_count: int = 0
-    detected_at: datetime
-    resolved_at: Optional[datetime] = None
     resolved_by: Optional[str] = None
-    
-    class Config:
-        from_attributes = True
 
 
-class ViolationUpdate(BaseModel):
-    """Update violation."""
-    status: Optional[IncidentStatus] = None
-    severity: Optional[IncidentSeverity] = None
-    resolution_notes: Optional[str] = None
+ViolationUpdate = make_partial(
+    ViolationResponse,
+    "ViolationUpdate",
+    "Update violation.",
+    include=("status", "severity"),
+    resolution_notes=str
+)
 
 
 class FalsePositiveRequest(BaseModel):
@@ -426,16 +552,23 @@ class ForensicsSearchRequest(BaseModel):
     """Search parameters for forensics."""
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
-    site_ids: Optional[List[str]] = None
-    zone_ids: Optional[List[str]] = None
-    camera_ids: Optional[List[str]] = None
-    detection_types: Optional[List[DetectionType]] = None
-    severities: Optional[List[IncidentSeverity]] = None
-    statuses: Optional[List[IncidentStatus]] = None
+    site_ids: Optional[FrozenSet[str]] = None
+    zone_ids: Optional[FrozenSet[str]] = None
+    camera_ids: Optional[FrozenSet[str]] = None
+    detection_types: Optional[FrozenSet[FastDetectionType]] = None
+    severities: Optional[FrozenSet[FastIncidentSeverity]] = None
+    statuses: Optional[FrozenSet[FastIncidentStatus]] = None
     min_confidence: Optional[float] = Field(None, ge=0.0, le=1.0)
     max_confidence: Optional[float] = Field(None, ge=0.0, le=1.0)
     include_false_positives: bool = False
     search_text: Optional[str] = None  # Search in descriptions/comments
+    sort_order: Literal["desc", "asc"] = "desc"  # By detection time
+    
+    @field_validator("site_ids", "zone_ids", "camera_ids", "detection_types", "severities", "statuses")
+    @classmethod
+    def _empty_filter_to_none(cls, v):
+        """An empty filter set means "no filter"."""
+        return v or None
 
 
 class ForensicsSearchResponse(BaseModel):
@@ -447,6 +580,8 @@ class ForensicsSearchResponse(BaseModel):
     total_pages: int
     has_next: bool
     has_previous: bool
+    
+    model_config = ConfigDict(frozen=True)
 
 
 # =============================================================================
@@ -455,13 +590,13 @@ class ForensicsSearchResponse(BaseModel):
 
 class MediaUploadRequest(BaseModel):
     """Media upload metadata."""
-    purpose: MediaPurpose
-    media_type: MediaType
+    purpose: FastMediaPurpose
+    media_type: FastMediaType
     description: Optional[str] = None
     site_id: Optional[str] = None
     zone_id: Optional[str] = None
-    detection_type: Optional[DetectionType] = None  # For training data
-    labels: Optional[List[str]] = []  # For AI training labels
+    detection_type: Optional[FastDetectionType] = None  # For training data
+    labels: Optional[List[str]] = Field(default_factory=list)  # For AI training labels
 
 
 class MediaUploadResponse(BaseModel):
@@ -471,14 +606,16 @@ class MediaUploadResponse(BaseModel):
     original_url: str
     blurred_url: Optional[str] = None
     thumbnail_url: Optional[str] = None
-    media_type: MediaType
-    purpose: MediaPurpose
+    media_type: FastMediaType
+    purpose: FastMediaPurpose
     file_size_bytes: int
     duration_seconds: Optional[float] = None
     uploaded_by: str
     uploaded_at: datetime
     analysis_status: str = "pending"  # pending, processing, completed, failed
     analysis_results: Optional[Dict[str, Any]] = None
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class MediaListResponse(BaseModel):
@@ -487,6 +624,8 @@ class MediaListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    
+    model_config = ConfigDict(frozen=True)
 
 
 # =============================================================================
@@ -495,20 +634,21 @@ class MediaListResponse(BaseModel):
 
 class UserCreateAdmin(BaseModel):
     """Admin user creation."""
-    email: EmailStr
+    email: LazyEmailStr
     full_name: str
     password: str
-    role: UserRole
+    role: FastUserRole
     organization_id: str
-    site_ids: Optional[List[str]] = []  # Sites user can access
+    site_ids: Optional[List[str]] = Field(default_factory=list)  # Sites user can access
 
 
-class UserUpdateAdmin(BaseModel):
-    """Admin user update."""
-    full_name: Optional[str] = None
-    role: Optional[UserRole] = None
-    is_active: Optional[bool] = None
-    site_ids: Optional[List[str]] = None
+UserUpdateAdmin = make_partial(
+    UserResponse,
+    "UserUpdateAdmin",
+    "Admin user update.",
+    include=("full_name", "role", "is_active"),
+    site_ids=List[str]
+)
 
 
 class UserListResponse(BaseModel):
@@ -517,36 +657,60 @@ class UserListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    
+    model_config = ConfigDict(frozen=True)
+
+
+class UserSummary(BaseModel):
+    """User projection for list views."""
+    id: str
+    email: str
+    full_name: str
+    role: FastUserRole
+
+
+class UserSummaryListResponse(BaseModel):
+    """Paginated user summary list."""
+    items: List[UserSummary]
+    total: int
+    page: int
+    page_size: int
+    
+    model_config = ConfigDict(frozen=True)
 
 
 # =============================================================================
 # SITE/ZONE/CAMERA MANAGEMENT SCHEMAS
 # =============================================================================
 
-class SiteUpdate(BaseModel):
-    """Update site."""
-    name: Optional[str] = None
-    address: Optional[str] = None
-    timezone: Optional[str] = None
-    is_active: Optional[bool] = None
+SiteUpdate = make_partial(SiteBase, "SiteUpdate", "Update site.", is_active=bool)
 
+ZoneUpdate = make_partial(
+    ZoneBase,
+    "ZoneUpdate",
+    "Update zone.",
+    validators={"_validate_polygon": field_validator("polygon_coordinates")(_check_flat_polygon)},
+    is_active=bool
+)
 
-class ZoneUpdate(BaseModel):
-    """Update zone."""
-    name: Optional[str] = None
-    zone_type: Optional[str] = None
-    polygon_coordinates: Optional[List[Dict[str, float]]] = None
-    max_allowed: Optional[int] = None
-    is_active: Optional[bool] = None
+CameraUpdate = make_partial(CameraBase, "CameraUpdate", "Update camera.", is_active=bool, policy_id=str)
 
 
-class CameraUpdate(BaseModel):
-    """Update camera."""
-    name: Optional[str] = None
-    stream_url: Optional[str] = None
-    location_description: Optional[str] = None
-    is_active: Optional[bool] = None
-    policy_id: Optional[str] = None
+class ZoneSummary(BaseModel):
+    """Zone projection for list views (no polygon)."""
+    id: str
+    name: str
+    zone_type: str
+    site_id: str
+    is_active: bool
+
+
+class CameraSummary(BaseModel):
+    """Camera projection for list views."""
+    id: str
+    name: str
+    site_id: str
+    status: str
 
 
 # =============================================================================
@@ -560,7 +724,7 @@ class ReportBuilderRequest(BaseModel):
     start_date: datetime
     end_date: datetime
     site_ids: Optional[List[str]] = None
-    detection_types: Optional[List[DetectionType]] = None
+    detection_types: Optional[List[FastDetectionType]] = None
     include_sections: List[str] = ["summary", "trends", "violations", "recommendations"]
     chart_types: List[str] = ["bar", "line", "pie"]
     group_by: str = "day"  # day, week, month
@@ -576,6 +740,8 @@ class ReportBuilderResponse(BaseModel):
     preview_data: Optional[Dict[str, Any]] = None
     created_at: datetime
     completed_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(frozen=True)
 
 
 # =============================================================================
@@ -586,8 +752,8 @@ class AlertConfig(BaseModel):
     """Alert configuration."""
     id: str
     name: str
-    detection_types: List[DetectionType]
-    severity_threshold: IncidentSeverity
+    detection_types: List[FastDetectionType]
+    severity_threshold: FastIncidentSeverity
     confidence_threshold: float = 0.95
     site_ids: Optional[List[str]] = None
     zone_ids: Optional[List[str]] = None
@@ -595,7 +761,7 @@ class AlertConfig(BaseModel):
     visual_enabled: bool = True
     email_enabled: bool = False
     sms_enabled: bool = False
-    recipients: List[str] = []
+    recipients: List[str] = Field(default_factory=list)
     is_active: bool = True
 
 
@@ -604,8 +770,8 @@ class AlertEvent(BaseModel):
     id: str
     violation_id: str
     alert_config_id: str
-    detection_type: DetectionType
-    severity: IncidentSeverity
+    detection_type: FastDetectionType
+    severity: FastIncidentSeverity
     confidence: float
     site_name: str
     zone_name: Optional[str]
@@ -614,3 +780,68 @@ class AlertEvent(BaseModel):
     triggered_at: datetime
     acknowledged: bool = False
     acknowledged_by: Optional[str] = None
+
+
+# =============================================================================
+# TRUSTED CONSTRUCTION
+# =============================================================================
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _construct_plan(cls: Type[BaseModel]) -> Tuple[Tuple[str, Optional[Type[BaseModel]]], ...]:
+    """Field names of a model, each paired with its nested list item model if any."""
+    plan = []
+    for name, field in cls.model_fields.items():
+        nested = None
+        if get_origin(field.annotation) is list:
+            (item,) = get_args(field.annotation)
+            if isinstance(item, type) and issubclass(item, BaseModel):
+                nested = item
+        plan.append((name, nested))
+    return tuple(plan)
+
+
+def fast_from_orm(cls: Type[ModelT], obj: Any) -> ModelT:
+    """Build a response model from a trusted row or record without validation.
+    
+    Reads attributes (or keys, for mappings) named after the model fields and
+    calls model_construct; missing fields fall back to their defaults. Lists of
+    nested models are constructed the same way so they serialize cleanly.
+    Only use this for data the application produced itself, never request input.
+    """
+    if isinstance(obj, Mapping):
+        get = obj.get
+    else:
+        def get(name, default):
+            return getattr(obj, name, default)
+    values = {}
+    for name, nested in _construct_plan(cls):
+        value = get(name, _MISSING)
+        if value is _MISSING:
+            continue
+        if nested is not None and value:
+            value = [v if isinstance(v, nested) else fast_from_orm(nested, v) for v in value]
+        values[name] = value
+    return cls.model_construct(**values)
+
+
+# =============================================================================
+# LIST SERIALIZERS
+# =============================================================================
+
+# Built once; dump a whole page of items in a single pydantic-core call
+VIOLATION_LIST_ADAPTER = TypeAdapter(List[ViolationResponse])
+USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
+MEDIA_LIST_ADAPTER = TypeAdapter(List[MediaUploadResponse])
+
+
+# Finish building every model now so an incomplete schema fails at import
+# rather than on the first request that touches it
+for _model in [
+    obj for obj in globals().values()
+    if isinstance(obj, type) and issubclass(obj, BaseModel) and obj is not BaseModel
+]:
+    _model.model_rebuild()
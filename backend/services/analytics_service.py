@@ -1,14 +1,102 @@
 """Analytics service for safety metrics, KPIs, and predictive analytics."""
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import calendar
+import hashlib
+import time
+from collections import Counter, OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Union
 import numpy as np
-from collections import defaultdict
 
 from models.schemas import (
-    SafetyScoreData, IncidentTrendData, LocationRiskData,
+    SafetyScoreData, IncidentTrendData, SeverityBreakdown, LocationRiskData,
     KPIDashboardData, IncidentSeverity, ViolationType
 )
 
+try:
+    from numba import njit
+except ImportError:  # optional: the pure-Python kernels below are used instead
+    njit = None
+
+
+def _risk_stats(counts: np.ndarray, alpha: float):
+    """Exponentially smoothed last value, mean and standard deviation of ``counts``.
+    
+    All three come from a single pass; the variance uses Welford's update.
+    """
+    values = counts.tolist()
+    smoothed = values[0]
+    mean = 0.0
+    m2 = 0.0
+    for n, count in enumerate(values, 1):
+        if n > 1:
+            smoothed = alpha * count + (1 - alpha) * smoothed
+        delta = count - mean
+        mean += delta / n
+        m2 += delta * (count - mean)
+    return smoothed, mean, (m2 / len(values)) ** 0.5
+
+
+if njit is not None:
+    # Explicit signature: compiled at import, not on the first request
+    @njit("UniTuple(float64, 3)(float64[::1], float64)", cache=True, fastmath=True)
+    def _risk_stats(counts, alpha):
+        smoothed = counts[0]
+        mean = 0.0
+        m2 = 0.0
+        for i in range(counts.shape[0]):
+            count = counts[i]
+            if i > 0:
+                smoothed = alpha * count + (1.0 - alpha) * smoothed
+            delta = count - mean
+            mean += delta / (i + 1)
+            m2 += delta * (count - mean)
+        return smoothed, mean, np.sqrt(m2 / counts.shape[0])
+
+
+@dataclass
+class IncidentColumns:
+    """Incident fields used by analytics, as parallel arrays (one entry per incident)."""
+    now: np.datetime64  # build time; the reference point for time comparisons
+    detected_at: np.ndarray  # datetime64[s]; missing times filled with the build time
+    severity_code: np.ndarray  # int8 index into AnalyticsService._WEIGHTS_ARR
+    violation_type: np.ndarray  # object; None where missing
+    violation_code: np.ndarray  # int64 index into violation_labels
+    violation_category: np.ndarray  # int8 index into AnalyticsService.ROOT_CAUSES; 3 for other
+    site_id: np.ndarray  # int64 index into site_labels
+    zone_id: np.ndarray  # int64 index into zone_labels, -1 without a zone
+    site_labels: List[Any]
+    zone_labels: List[Any]
+    violation_labels: List[Any]
+    is_recordable: np.ndarray  # bool
+    lost_time_days: np.ndarray  # int32
+    
+    def __len__(self) -> int:
+        return len(self.detected_at)
+
+
+# Analytics methods take raw incident records or columns built from them
+Incidents = Union[List[Dict], IncidentColumns]
+
+
+@dataclass
+class CorrectiveActionColumns:
+    """Corrective action fields used by analytics, as parallel arrays (one entry per action)."""
+    now: np.datetime64  # build time; the reference point for time comparisons
+    is_completed: np.ndarray  # bool
+    incident_type: np.ndarray  # object; None where missing
+    created_at: np.ndarray  # datetime64[us]; NaT where missing
+    completed_at: np.ndarray  # datetime64[us]; NaT where missing
+    due_date: np.ndarray  # datetime64[us]; NaT where missing
+    
+    def __len__(self) -> int:
+        return len(self.is_completed)
+
+
+# Likewise for corrective action records
+CorrectiveActions = Union[List[Dict], CorrectiveActionColumns]
+
 
 class AnalyticsService:
     """Service for computing safety analytics and KPIs."""
@@ -20,45 +108,197 @@ class AnalyticsService:
         IncidentSeverity.MEDIUM: 2,
         IncidentSeverity.LOW: 1
     }
+    # Dense severity codes and the same weights as an array indexed by code,
+    # so per-incident weights are one vectorized gather
+    SEVERITY_CODE = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+    SEVERITY_NAMES = tuple(SEVERITY_CODE)
+    _WEIGHTS_ARR = np.array([10, 5, 2, 1], dtype=np.int32)
+    
+    # Violation type keywords, in match priority; the index is the category code
+    VIOLATION_CATEGORIES = ("ppe", "proximity", "zone")
+    # Root cause and contributing factors per violation category
+    ROOT_CAUSES = (
+        ("PPE Non-Compliance", ("Training Gap", "Awareness")),
+        ("Unsafe Distance", ("Spatial Awareness",)),
+        ("Zone Violation", ("Signage/Barriers",)),
+    )
+    
+    # Shifts in shift-index order, and the hours at which morning, afternoon
+    # and night begin
+    SHIFTS = ("morning", "afternoon", "night")
+    _SHIFT_BOUNDS = np.array([6, 14, 22], dtype=np.int64)
     
     # Industry benchmark values
     INDUSTRY_TRIR_BENCHMARK = 3.0
     INDUSTRY_LTIFR_BENCHMARK = 1.5
     
+    # Memoized safety scores; entries also age out with the clock because
+    # the trend and compliance parts compare against the current time
+    SCORE_MEMO_SIZE = 64
+    SCORE_MEMO_SECONDS = 60
+    
     def __init__(self):
         """Initialize analytics service."""
-        pass
+        self._score_memo: "OrderedDict[tuple, SafetyScoreData]" = OrderedDict()
+    
+    def to_columns(self, incidents: List[Dict]) -> IncidentColumns:
+        """Read incident records into columns in a single pass.
+        
+        Build this once per request and pass it to every analytics method
+        instead of the records, so the dicts are walked only once.
+        Missing or unknown severities count as low.
+        """
+        now = datetime.now()
+        severity_code = self.SEVERITY_CODE
+        site_codes: Dict[Any, int] = {}
+        zone_codes: Dict[Any, int] = {}
+        violation_codes: Dict[Any, int] = {}
+        detected_at, severity, violation_type, violation, site, zone, recordable, lost_time = (
+            [], [], [], [], [], [], [], []
+        )
+        for incident in incidents:
+            detected_at.append(incident.get('detected_at', now))
+            severity.append(severity_code.get(incident.get('severity', 'low'), 3))
+            violation_type.append(incident.get('violation_type'))
+            violation.append(violation_codes.setdefault(violation_type[-1], len(violation_codes)))
+            site.append(site_codes.setdefault(incident.get('site_id'), len(site_codes)))
+            zone_id = incident.get('zone_id')
+            zone.append(zone_codes.setdefault(zone_id, len(zone_codes)) if zone_id else -1)
+            recordable.append(incident.get('is_recordable', True))
+            lost_time.append(incident.get('lost_time_days', 0))
+        
+        types = np.empty(len(violation_type), dtype=object)
+        types[:] = violation_type
+        violation_code = np.array(violation, dtype=np.int64)
+        # Categorize each distinct type once, then gather per incident
+        label_category = np.array(
+            [self._violation_category(label) for label in violation_codes], dtype=np.int8
+        )
+        return IncidentColumns(
+            now=np.datetime64(now),
+            detected_at=np.array(detected_at, dtype='datetime64[s]'),
+            severity_code=np.array(severity, dtype=np.int8),
+            violation_type=types,
+            violation_code=violation_code,
+            violation_category=label_category[violation_code],
+            site_id=np.array(site, dtype=np.int64),
+            zone_id=np.array(zone, dtype=np.int64),
+            site_labels=list(site_codes),
+            zone_labels=list(zone_codes),
+            violation_labels=list(violation_codes),
+            is_recordable=np.array(recordable, dtype=bool),
+            lost_time_days=np.array(lost_time, dtype=np.int32)
+        )
+    
+    def to_action_columns(self, corrective_actions: List[Dict]) -> CorrectiveActionColumns:
+        """Read corrective action records into columns in a single pass."""
+        statuses, incident_type, created_at, completed_at, due_date = [], [], [], [], []
+        for ca in corrective_actions:
+            statuses.append(ca.get('status'))
+            incident_type.append(ca.get('incident_type'))
+            created_at.append(ca.get('created_at'))
+            completed_at.append(ca.get('completed_at'))
+            due_date.append(ca.get('due_date'))
+        types = np.empty(len(incident_type), dtype=object)
+        types[:] = incident_type
+        return CorrectiveActionColumns(
+            now=np.datetime64(datetime.now(), 'us'),
+            is_completed=np.array(statuses, dtype=object) == 'completed',
+            incident_type=types,
+            created_at=np.array(created_at, dtype='datetime64[us]'),
+            completed_at=np.array(completed_at, dtype='datetime64[us]'),
+            due_date=np.array(due_date, dtype='datetime64[us]')
+        )
+    
+    def _action_columns(self, corrective_actions: CorrectiveActions) -> CorrectiveActionColumns:
+        """Columns for ``corrective_actions``, building them if given raw records."""
+        if isinstance(corrective_actions, CorrectiveActionColumns):
+            return corrective_actions
+        return self.to_action_columns(corrective_actions)
+    
+    def _digest(self, cols: IncidentColumns, actions: CorrectiveActionColumns) -> bytes:
+        """Content digest of the columns that feed the safety score."""
+        digest = hashlib.blake2b(digest_size=16)
+        for column in (
+            cols.detected_at, cols.severity_code, cols.is_recordable, cols.lost_time_days,
+            actions.is_completed, actions.due_date
+        ):
+            digest.update(column.tobytes())
+        return digest.digest()
+    
+    def _violation_category(self, violation_type: Optional[str]) -> int:
+        """Category code of a violation type: the first keyword it contains, else other."""
+        lowered = (violation_type or '').lower()
+        for code, keyword in enumerate(self.VIOLATION_CATEGORIES):
+            if keyword in lowered:
+                return code
+        return len(self.VIOLATION_CATEGORIES)
+    
+    def _columns(self, incidents: Incidents) -> IncidentColumns:
+        """Columns for ``incidents``, building them if given raw records."""
+        if isinstance(incidents, IncidentColumns):
+            return incidents
+        return self.to_columns(incidents)
+    
+    def _hour_of_day(self, ts: np.ndarray) -> np.ndarray:
+        """Hour (0-23) of each datetime64 timestamp."""
+        return ts.astype('datetime64[h]').astype(np.int64) % 24
+    
+    def _iso_week(self, days: np.ndarray) -> np.ndarray:
+        """ISO week number of each datetime64[D] date."""
+        # An ISO week belongs to the year of its Thursday
+        weekday = (days.astype(np.int64) + 3) % 7
+        thursday = days - weekday + 3
+        year_start = thursday.astype('datetime64[Y]').astype('datetime64[D]')
+        return (thursday - year_start).astype(np.int64) // 7 + 1
+    
+    def _shift_index(self, hours: np.ndarray) -> np.ndarray:
+        """Index into SHIFTS per hour: morning 6-14, afternoon 14-22, night otherwise."""
+        # Bound slots 0-3 are before 6, morning, afternoon, from 22; rotate onto SHIFTS
+        return (np.searchsorted(self._SHIFT_BOUNDS, hours, side='right') + 2) % 3
     
     async def calculate_safety_score(
         self,
-        incidents: List[Dict],
+        incidents: Incidents,
         near_misses: List[Dict],
-        corrective_actions: List[Dict],
+        corrective_actions: CorrectiveActions,
         total_work_hours: float,
         period_days: int = 30
     ) -> SafetyScoreData:
         """Calculate comprehensive safety score with multiple KPIs."""
+        cols = self._columns(incidents)
+        actions = self._action_columns(corrective_actions)
+        
+        # Dashboards poll this with unchanged inputs; reuse a recent result
+        memo_key = (
+            self._digest(cols, actions),
+            len(near_misses),
+            total_work_hours,
+            period_days,
+            int(time.monotonic() // self.SCORE_MEMO_SECONDS)
+        )
+        cached = self._score_memo.get(memo_key)
+        if cached is not None:
+            self._score_memo.move_to_end(memo_key)
+            return cached
         
         # Calculate TRIR (Total Recordable Incident Rate)
         # Formula: (Number of incidents * 200,000) / Total hours worked
-        recordable_incidents = len([i for i in incidents if i.get('is_recordable', True)])
+        recordable_incidents = int(cols.is_recordable.sum())
         trir = (recordable_incidents * 200000) / max(total_work_hours, 1)
         
         # Calculate LTIFR (Lost Time Injury Frequency Rate)
-        lost_time_incidents = len([i for i in incidents if i.get('lost_time_days', 0) > 0])
+        lost_time_incidents = int((cols.lost_time_days > 0).sum())
         ltifr = (lost_time_incidents * 1000000) / max(total_work_hours, 1)
         
         # Calculate severity-weighted incident index
-        severity_index = sum(
-            self.SEVERITY_WEIGHTS.get(IncidentSeverity(i.get('severity', 'low')), 1)
-            for i in incidents
-        ) / max(len(incidents), 1)
+        severity_index = float(self._WEIGHTS_ARR[cols.severity_code].sum()) / max(len(cols), 1)
         
         # Calculate predictive risk probability using historical trends
-        predictive_probability = await self._calculate_predictive_risk(incidents, period_days)
+        predictive_probability = await self._calculate_predictive_risk(cols, period_days)
         
         # Calculate compliance coverage
-        compliance_coverage = await self._calculate_compliance_coverage(corrective_actions)
+        compliance_coverage = await self._calculate_compliance_coverage(actions)
         
         # Calculate overall safety score (0-100)
         # Higher is better - penalize for high TRIR, LTIFR, and severity
@@ -77,9 +317,9 @@ class AnalyticsService:
         )
         
         # Determine trend
-        trend = await self._calculate_trend(incidents, period_days)
+        trend = await self._calculate_trend(cols, period_days)
         
-        return SafetyScoreData(
+        score = SafetyScoreData(
             overall_score=round(overall_score, 1),
             trir=round(trir, 3),
             ltifr=round(ltifr, 3),
@@ -88,35 +328,29 @@ class AnalyticsService:
             compliance_coverage=round(compliance_coverage, 1),
             trend=trend
         )
+        self._score_memo[memo_key] = score
+        if len(self._score_memo) > self.SCORE_MEMO_SIZE:
+            self._score_memo.popitem(last=False)
+        return score
     
     async def _calculate_predictive_risk(
         self,
-        incidents: List[Dict],
+        cols: IncidentColumns,
         period_days: int
     ) -> float:
         """Calculate predictive risk probability based on historical patterns."""
-        if not incidents:
+        if not len(cols):
             return 0.1  # Base risk probability
         
-        # Group incidents by day
-        daily_counts = defaultdict(int)
-        for incident in incidents:
-            date = incident.get('detected_at', datetime.now()).date()
-            daily_counts[date] += 1
+        # Group incidents by day, in order of first appearance
+        daily_counts = Counter(cols.detected_at.astype('datetime64[D]').tolist())
         
         if not daily_counts:
             return 0.1
         
-        # Calculate rolling average and variance
-        counts = list(daily_counts.values())
-        mean_incidents = np.mean(counts)
-        std_incidents = np.std(counts) if len(counts) > 1 else 0
-        
-        # Simple exponential smoothing for prediction
-        alpha = 0.3
-        smoothed = counts[0]
-        for count in counts[1:]:
-            smoothed = alpha * count + (1 - alpha) * smoothed
+        # Simple exponential smoothing for prediction, with mean and variance
+        counts = np.fromiter(daily_counts.values(), dtype=np.float64, count=len(daily_counts))
+        smoothed, mean_incidents, std_incidents = _risk_stats(counts, 0.3)
         
         # Probability increases with higher smoothed value and variance
         base_probability = min(smoothed / 10, 1.0)
@@ -126,41 +360,38 @@ class AnalyticsService:
     
     async def _calculate_compliance_coverage(
         self,
-        corrective_actions: List[Dict]
+        corrective_actions: CorrectiveActions
     ) -> float:
         """Calculate compliance coverage based on corrective action completion."""
-        if not corrective_actions:
+        actions = self._action_columns(corrective_actions)
+        if not len(actions):
             return 100.0
         
-        completed = len([ca for ca in corrective_actions if ca.get('status') == 'completed'])
-        overdue = len([
-            ca for ca in corrective_actions
-            if ca.get('status') != 'completed' and
-            ca.get('due_date', datetime.now()) < datetime.now()
-        ])
+        # Actions without a due date compare False (NaT) and are never overdue
+        completed = int(np.count_nonzero(actions.is_completed))
+        overdue = int(np.count_nonzero(~actions.is_completed & (actions.due_date < actions.now)))
         
-        completion_rate = (completed / len(corrective_actions)) * 100
+        completion_rate = (completed / len(actions)) * 100
         overdue_penalty = overdue * 5
         
         return max(0, completion_rate - overdue_penalty)
     
     async def _calculate_trend(
         self,
-        incidents: List[Dict],
+        cols: IncidentColumns,
         period_days: int
     ) -> str:
         """Determine if safety is improving, stable, or declining."""
-        if len(incidents) < 5:
+        if len(cols) < 5:
             return "stable"
         
         # Split into two periods
-        mid_point = datetime.now() - timedelta(days=period_days // 2)
-        
-        first_half = [i for i in incidents if i.get('detected_at', datetime.now()) < mid_point]
-        second_half = [i for i in incidents if i.get('detected_at', datetime.now()) >= mid_point]
+        mid_point = cols.now - np.timedelta64(period_days // 2, 'D')
+        first_count = int(np.count_nonzero(cols.detected_at < mid_point))
+        second_count = len(cols) - first_count
         
-        first_rate = len(first_half) / max(period_days // 2, 1)
-        second_rate = len(second_half) / max(period_days // 2, 1)
+        first_rate = first_count / max(period_days // 2, 1)
+        second_rate = second_count / max(period_days // 2, 1)
         
         change_ratio = (second_rate - first_rate) / max(first_rate, 0.1)
         
@@ -172,166 +403,163 @@ class AnalyticsService:
     
     async def get_incident_trends(
         self,
-        incidents: List[Dict],
+        incidents: Incidents,
         period_days: int = 30,
         granularity: str = "daily"
     ) -> List[IncidentTrendData]:
         """Get incident trends over time."""
-        trends = []
-        
-        # Group by date
-        date_groups = defaultdict(lambda: {"count": 0, "severity": defaultdict(int)})
-        
-        for incident in incidents:
-            date = incident.get('detected_at', datetime.now())
-            if granularity == "daily":
-                key = date.strftime("%Y-%m-%d")
-            elif granularity == "weekly":
-                key = f"Week {date.isocalendar()[1]}"
-            else:
-                key = date.strftime("%Y-%m")
-            
-            date_groups[key]["count"] += 1
-            severity = incident.get('severity', 'low')
-            date_groups[key]["severity"][severity] += 1
+        cols = self._columns(incidents)
+        
+        # Bucket every incident by date in one pass
+        if granularity == "daily":
+            bucket = cols.detected_at.astype('datetime64[D]').astype(np.int64)
+        elif granularity == "weekly":
+            bucket = self._iso_week(cols.detected_at.astype('datetime64[D]'))
+        else:
+            bucket = cols.detected_at.astype('datetime64[M]').astype(np.int64)
+        
+        # Count (bucket, severity) pairs with one unique + bincount
+        levels = len(self.SEVERITY_NAMES)
+        buckets, group = np.unique(bucket, return_inverse=True)
+        breakdown = np.bincount(
+            group * levels + cols.severity_code, minlength=len(buckets) * levels
+        ).reshape(-1, levels)
+        
+        if granularity == "daily":
+            labels = np.datetime_as_string(buckets.astype('datetime64[D]')).tolist()
+        elif granularity == "weekly":
+            labels = [f"Week {week}" for week in buckets.tolist()]
+        else:
+            labels = np.datetime_as_string(buckets.astype('datetime64[M]')).tolist()
         
         # Convert to trend data
-        for date_key, data in sorted(date_groups.items()):
-            trends.append(IncidentTrendData(
-                date=date_key,
-                incident_count=data["count"],
-                severity_breakdown=dict(data["severity"])
-            ))
-        
-        return trends
+        return [
+            IncidentTrendData(
+                date=label,
+                incident_count=sum(counts),
+                severity_breakdown=SeverityBreakdown(**dict(zip(self.SEVERITY_NAMES, counts)))
+            )
+            for label, counts in sorted(zip(labels, breakdown.tolist()))
+        ]
     
     async def get_location_risk_analysis(
         self,
-        incidents: List[Dict],
+        incidents: Incidents,
         sites: List[Dict],
         zones: List[Dict]
     ) -> List[LocationRiskData]:
         """Analyze risk by location/zone."""
-        location_risks = []
-        
-        # Group incidents by site and zone
-        site_incidents = defaultdict(list)
-        zone_incidents = defaultdict(list)
-        
-        for incident in incidents:
-            site_incidents[incident.get('site_id')].append(incident)
-            if incident.get('zone_id'):
-                zone_incidents[incident.get('zone_id')].append(incident)
+        cols = self._columns(incidents)
+        n_sites = len(cols.site_labels)
+        n_types = len(cols.violation_labels)
+        
+        # Group by the dense site ids: counts and severity sums are single scatters
+        site_counts = np.bincount(cols.site_id, minlength=n_sites)
+        site_severity = np.bincount(
+            cols.site_id, weights=self._WEIGHTS_ARR[cols.severity_code], minlength=n_sites
+        ).astype(np.int64)
+        
+        # Calculate risk score based on frequency and severity
+        risk_scores = np.minimum(100, site_counts * 5 + site_severity * 2)
+        
+        # Get top violation types: count (site, type) pairs, then order them by
+        # site, descending count and first appearance, keeping three per site
+        pairs, first_seen, pair_counts = np.unique(
+            cols.site_id * n_types + cols.violation_code, return_index=True, return_counts=True
+        )
+        pair_site = pairs // max(n_types, 1)
+        order = np.lexsort((first_seen, -pair_counts, pair_site))
+        # Each site's pairs are now contiguous: rank them within the site and
+        # keep ranks 0-2, so only the winners reach Python
+        _, starts = np.unique(pair_site[order], return_index=True)
+        rank = np.arange(len(order)) - np.repeat(starts, np.diff(np.append(starts, len(order))))
+        top = order[rank < 3]
+        top_violations = defaultdict(list)
+        for pair, count in zip(pairs[top].tolist(), pair_counts[top].tolist()):
+            top_violations[pair // n_types].append(
+                {"type": cols.violation_labels[pair % n_types] or 'unknown', "count": count}
+            )
         
         # Calculate risk for each site
         site_map = {s.get('id'): s for s in sites}
-        zone_map = {z.get('id'): z for z in zones}
-        
-        for site_id, site_inc in site_incidents.items():
-            site = site_map.get(site_id, {})
-            
-            # Calculate risk score based on frequency and severity
-            severity_sum = sum(
-                self.SEVERITY_WEIGHTS.get(IncidentSeverity(i.get('severity', 'low')), 1)
-                for i in site_inc
-            )
-            risk_score = min(100, (len(site_inc) * 5) + (severity_sum * 2))
-            
-            # Get top violation types
-            violation_counts = defaultdict(int)
-            for inc in site_inc:
-                violation_counts[inc.get('violation_type', 'unknown')] += 1
-            
-            top_violations = [
-                {"type": k, "count": v}
-                for k, v in sorted(violation_counts.items(), key=lambda x: -x[1])[:3]
-            ]
-            
-            location_risks.append(LocationRiskData(
+        location_risks = [
+            LocationRiskData(
                 site_id=site_id,
-                site_name=site.get('name', 'Unknown Site'),
+                site_name=site_map.get(site_id, {}).get('name', 'Unknown Site'),
                 zone_id=None,
                 zone_name=None,
-                incident_count=len(site_inc),
+                incident_count=incident_count,
                 risk_score=risk_score,
-                top_violation_types=top_violations
-            ))
+                top_violation_types=top_violations[site_code]
+            )
+            for site_code, (site_id, incident_count, risk_score) in enumerate(
+                zip(cols.site_labels, site_counts.tolist(), risk_scores.tolist())
+            )
+        ]
         
         return sorted(location_risks, key=lambda x: -x.risk_score)
     
     async def get_root_cause_analysis(
         self,
-        incidents: List[Dict]
+        incidents: Incidents
     ) -> Dict[str, Any]:
         """Analyze root causes and contributing factors."""
+        cols = self._columns(incidents)
         root_causes = defaultdict(int)
         contributing_factors = defaultdict(int)
         
-        for incident in incidents:
-            # Categorize by violation type patterns
-            violation_type = incident.get('violation_type', '')
-            
-            if 'ppe' in violation_type.lower():
-                root_causes['PPE Non-Compliance'] += 1
-                contributing_factors['Training Gap'] += 1
-                contributing_factors['Awareness'] += 1
-            elif 'proximity' in violation_type.lower():
-                root_causes['Unsafe Distance'] += 1
-                contributing_factors['Spatial Awareness'] += 1
-            elif 'zone' in violation_type.lower():
-                root_causes['Zone Violation'] += 1
-                contributing_factors['Signage/Barriers'] += 1
-            
-            # Time-based factors
-            detected_at = incident.get('detected_at', datetime.now())
-            hour = detected_at.hour
-            if 6 <= hour < 14:
-                contributing_factors['Morning Shift'] += 1
-            elif 14 <= hour < 22:
-                contributing_factors['Afternoon Shift'] += 1
-            else:
-                contributing_factors['Night Shift'] += 1
+        # Categorize by violation type patterns
+        category_counts = np.bincount(
+            cols.violation_category, minlength=len(self.VIOLATION_CATEGORIES) + 1
+        ).tolist()
+        for (cause, factors), count in zip(self.ROOT_CAUSES, category_counts):
+            if count:
+                root_causes[cause] += count
+                for factor in factors:
+                    contributing_factors[factor] += count
+        
+        # Time-based factors
+        shifts = self._shift_index(self._hour_of_day(cols.detected_at))
+        shift_factors = ('Morning Shift', 'Afternoon Shift', 'Night Shift')
+        for factor, count in zip(shift_factors, np.bincount(shifts, minlength=3).tolist()):
+            if count:
+                contributing_factors[factor] += count
         
         return {
             "root_causes": dict(sorted(root_causes.items(), key=lambda x: -x[1])),
             "contributing_factors": dict(sorted(contributing_factors.items(), key=lambda x: -x[1])),
-            "total_analyzed": len(incidents)
+            "total_analyzed": len(cols)
         }
     
     async def get_team_shift_analysis(
         self,
-        incidents: List[Dict]
+        incidents: Incidents
     ) -> Dict[str, Any]:
         """Analyze incidents by team and shift patterns."""
+        cols = self._columns(incidents)
+        ts = cols.detected_at
+        hours = self._hour_of_day(ts)
+        # Monday = 0; the epoch (1970-01-01) was a Thursday
+        weekdays = (ts.astype('datetime64[D]').astype(np.int64) + 3) % 7
+        
+        # Shift categorization
+        shifts = self._shift_index(hours)
+        shift_counts = np.bincount(shifts, minlength=3).tolist()
+        shift_severity = np.bincount(
+            shifts, weights=self._WEIGHTS_ARR[cols.severity_code], minlength=3
+        ).astype(np.int64).tolist()
         shift_data = {
-            "morning": {"count": 0, "severity_sum": 0},
-            "afternoon": {"count": 0, "severity_sum": 0},
-            "night": {"count": 0, "severity_sum": 0}
+            shift: {"count": count, "severity_sum": severity_sum}
+            for shift, count, severity_sum in zip(self.SHIFTS, shift_counts, shift_severity)
         }
         
-        hourly_distribution = defaultdict(int)
-        day_of_week = defaultdict(int)
-        
-        for incident in incidents:
-            detected_at = incident.get('detected_at', datetime.now())
-            hour = detected_at.hour
-            severity_weight = self.SEVERITY_WEIGHTS.get(
-                IncidentSeverity(incident.get('severity', 'low')), 1
-            )
-            
-            # Shift categorization
-            if 6 <= hour < 14:
-                shift_data["morning"]["count"] += 1
-                shift_data["morning"]["severity_sum"] += severity_weight
-            elif 14 <= hour < 22:
-                shift_data["afternoon"]["count"] += 1
-                shift_data["afternoon"]["severity_sum"] += severity_weight
-            else:
-                shift_data["night"]["count"] += 1
-                shift_data["night"]["severity_sum"] += severity_weight
-            
-            hourly_distribution[hour] += 1
-            day_of_week[detected_at.strftime("%A")] += 1
+        hourly_distribution = {
+            hour: count for hour, count in enumerate(np.bincount(hours, minlength=24).tolist()) if count
+        }
+        day_of_week = {
+            calendar.day_name[day]: count
+            for day, count in enumerate(np.bincount(weekdays, minlength=7).tolist()) if count
+        }
         
         # Find highest risk shift
         highest_risk_shift = max(
@@ -341,18 +569,19 @@ class AnalyticsService:
         
         return {
             "shift_breakdown": shift_data,
-            "hourly_distribution": dict(sorted(hourly_distribution.items())),
+            "hourly_distribution": hourly_distribution,
             "day_of_week_distribution": day_of_week,
             "highest_risk_shift": highest_risk_shift
         }
     
     async def get_action_effectiveness(
         self,
-        corrective_actions: List[Dict],
-        incidents: List[Dict]
+        corrective_actions: CorrectiveActions,
+        incidents: Incidents
     ) -> Dict[str, Any]:
         """Track effectiveness of corrective actions."""
-        if not corrective_actions:
+        actions = self._action_columns(corrective_actions)
+        if not len(actions):
             return {
                 "closure_rate": 0,
                 "average_time_to_close": 0,
@@ -360,41 +589,41 @@ class AnalyticsService:
                 "effectiveness_scores": []
             }
         
-        completed = [ca for ca in corrective_actions if ca.get('status') == 'completed']
-        closure_rate = (len(completed) / len(corrective_actions)) * 100
-        
-        # Calculate average time to close
-        close_times = []
-        for ca in completed:
-            if ca.get('completed_at') and ca.get('created_at'):
-                delta = ca['completed_at'] - ca['created_at']
-                close_times.append(delta.total_seconds() / 3600)  # Hours
-        
-        avg_close_time = np.mean(close_times) if close_times else 0
-        
-        # Calculate recurrence rate (incidents after corrective actions)
-        recurrence_count = 0
-        for ca in completed:
-            incident_type = ca.get('incident_type')
-            completed_at = ca.get('completed_at', datetime.now())
-            
-            recurring = [
-                i for i in incidents
-                if i.get('violation_type') == incident_type and
-                i.get('detected_at', datetime.now()) > completed_at
-            ]
-            if recurring:
-                recurrence_count += 1
-        
-        recurrence_rate = (recurrence_count / max(len(completed), 1)) * 100
+        completed = actions.is_completed
+        completed_count = int(np.count_nonzero(completed))
+        closure_rate = (completed_count / len(actions)) * 100
+        
+        # Calculate average time to close, over completed actions with both times
+        timed = completed & ~np.isnat(actions.completed_at) & ~np.isnat(actions.created_at)
+        close_hours = (actions.completed_at[timed] - actions.created_at[timed]).astype(np.int64) / 3.6e9
+        avg_close_time = close_hours.mean() if close_hours.size else 0
+        
+        # Calculate recurrence rate (incidents after corrective actions).
+        # Join on violation type: an action recurred if the latest incident of
+        # its type came after it was completed
+        cols = self._columns(incidents)
+        n_types = len(cols.violation_labels)
+        latest = np.full(n_types + 1, np.iinfo(np.int64).min)  # last slot: type never seen
+        np.maximum.at(latest, cols.violation_code, cols.detected_at.astype(np.int64))
+        type_code = {label: code for code, label in enumerate(cols.violation_labels)}
+        action_type = np.array(
+            [type_code.get(t, n_types) for t in actions.incident_type[completed].tolist()], dtype=np.int64
+        )
+        # Actions without a completion time are compared against the current time
+        completed_at = actions.completed_at[completed]
+        completed_at = np.where(np.isnat(completed_at), actions.now, completed_at)
+        completed_at = completed_at.astype('datetime64[s]').astype(np.int64)
+        recurrence_count = int(np.count_nonzero(latest[action_type] > completed_at))
+        
+        recurrence_rate = (recurrence_count / max(completed_count, 1)) * 100
         
         return {
             "closure_rate": round(closure_rate, 1),
             "average_time_to_close_hours": round(avg_close_time, 1),
             "recurrence_rate": round(recurrence_rate, 1),
-            "total_actions": len(corrective_actions),
-            "completed_actions": len(completed),
-            "pending_actions": len(corrective_actions) - len(completed)
+            "total_actions": len(actions),
+            "completed_actions": completed_count,
+            "pending_actions": len(actions) - completed_count
         }
     
     async def get_benchmark_comparison(
@@ -402,6 +631,11 @@ class AnalyticsService:
         safety_score: SafetyScoreData
     ) -> Dict[str, Any]:
         """Compare metrics against industry benchmarks."""
+        return self._benchmark_comparison(safety_score)
+    
+    @lru_cache(maxsize=64)
+    def _benchmark_comparison(self, safety_score: SafetyScoreData) -> Dict[str, Any]:
+        """Benchmark comparison for a (hashable, frozen) score; shared, so do not mutate."""
         return {
             "trir": {
                 "current": safety_score.trir,
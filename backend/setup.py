@@ -0,0 +1,26 @@
+"""Optional native build of the API schema module.
+
+Compiles models/schemas.py in place with Cython:
+
+    pip install "cython>=3.0"
+    python setup.py build_ext --inplace
+
+The resulting extension is imported in preference to schemas.py, which stays
+in the tree as the pure-Python fallback. Nothing else needs to change.
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="safetyvision-schemas",
+    ext_modules=cythonize(
+        ["models/schemas.py"],
+        compiler_directives={
+            "language_level": 3,
+            # Pydantic reads the annotations and needs real Python functions,
+            # so annotations must not become C types and functions must bind
+            "annotation_typing": False,
+            "binding": True,
+        },
+    ),
+)
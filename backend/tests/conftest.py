@@ -0,0 +1,21 @@
+"""Shared fixtures for the API tests."""
+import pytest
+from fastapi.testclient import TestClient
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from main import app
+
+
+@pytest.fixture(scope="session")
+def client() -> TestClient:
+    """Client for the app without its lifespan, so no Redis or Postgres is needed."""
+    FastAPICache.init(InMemoryBackend(), prefix="test")
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def auth_headers(client: TestClient) -> dict:
+    """Bearer headers for the demo login."""
+    response = client.post("/api/auth/login", json={"email": "tester@example.com", "password": "secret"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
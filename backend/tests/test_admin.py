@@ -0,0 +1,90 @@
+"""Admin CRUD must keep the lookup indexes and cached overview in sync."""
+
+
+def test_create_and_delete_camera_updates_site_listing_and_count(client, auth_headers):
+    def site_cameras() -> list:
+        response = client.get("/api/admin/cameras", params={"site_id": "site-002"}, headers=auth_headers)
+        assert response.status_code == 200
+        return [camera["id"] for camera in response.json()]
+    
+    def camera_count() -> int:
+        sites = client.get("/api/admin/sites", headers=auth_headers).json()
+        return next(site["camera_count"] for site in sites if site["id"] == "site-002")
+    
+    before = site_cameras()
+    response = client.post(
+        "/api/admin/cameras",
+        json={"name": "Line Camera 2", "stream_url": "rtsp://192.168.1.104:554/stream1", "site_id": "site-002"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    camera_id = response.json()["id"]
+    assert site_cameras() == before + [camera_id]
+    assert camera_count() == len(before) + 1
+    
+    response = client.delete(f"/api/admin/cameras/{camera_id}", headers=auth_headers)
+    assert response.status_code == 200
+    assert site_cameras() == before
+    assert camera_count() == len(before)
+    assert client.get("/api/admin/cameras", headers=auth_headers).json()[-1]["id"] != camera_id
+
+
+def test_duplicate_email_is_rejected_case_insensitively(client, auth_headers):
+    response = client.post(
+        "/api/admin/users",
+        json={
+            "email": "Admin@Company.COM",
+            "full_name": "Second Admin",
+            "password": "secret",
+            "role": "admin",
+            "organization_id": "org-001",
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already registered"
+
+
+def test_overview_role_counts_follow_user_create_and_delete(client, auth_headers):
+    def overview() -> dict:
+        response = client.get("/api/admin/overview", headers=auth_headers)
+        assert response.status_code == 200
+        return response.json()
+    
+    before = overview()
+    response = client.post(
+        "/api/admin/users",
+        json={
+            "email": "viewer@company.com",
+            "full_name": "Vera Viewer",
+            "password": "secret",
+            "role": "viewer",
+            "organization_id": "org-001",
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    user_id = response.json()["id"]
+    
+    after = overview()
+    assert after["total_users"] == before["total_users"] + 1
+    assert after["users_by_role"]["viewer"] == before["users_by_role"]["viewer"] + 1
+    assert {role: n for role, n in after["users_by_role"].items() if role != "viewer"} == {
+        role: n for role, n in before["users_by_role"].items() if role != "viewer"
+    }
+    
+    client.delete(f"/api/admin/users/{user_id}", headers=auth_headers)
+    assert overview() == before
+
+
+def test_streamed_listings_match_buffered(client, auth_headers):
+    for path, params in [
+        ("/api/admin/zones", {}),
+        ("/api/admin/zones", {"site_id": "site-001"}),
+        ("/api/admin/cameras", {}),
+        ("/api/admin/cameras", {"site_id": "site-003"}),
+    ]:
+        buffered = client.get(path, params=params, headers=auth_headers)
+        streamed = client.get(path, params={**params, "stream": True}, headers=auth_headers)
+        assert streamed.status_code == buffered.status_code == 200
+        assert streamed.json() == buffered.json()
@@ -0,0 +1,89 @@
+"""Indexed forensics search must agree with a linear scan of the demo data."""
+import pytest
+
+from api.routes.forensics import DEMO_VIOLATIONS, _search_matches
+from models.schemas import DetectionType, ForensicsSearchRequest, IncidentSeverity
+
+
+def _linear_search(search: ForensicsSearchRequest) -> list:
+    """The original list-comprehension filter and sort."""
+    filtered = DEMO_VIOLATIONS.copy()
+    if search.start_date:
+        filtered = [v for v in filtered if v["detected_at"] >= search.start_date]
+    if search.end_date:
+        filtered = [v for v in filtered if v["detected_at"] <= search.end_date]
+    if search.site_ids:
+        filtered = [v for v in filtered if v["site_id"] in search.site_ids]
+    if search.zone_ids:
+        filtered = [v for v in filtered if v["zone_id"] in search.zone_ids]
+    if search.camera_ids:
+        filtered = [v for v in filtered if v["camera_id"] in search.camera_ids]
+    if search.detection_types:
+        filtered = [v for v in filtered if v["detection_type"] in search.detection_types]
+    if search.severities:
+        filtered = [v for v in filtered if v["severity"] in search.severities]
+    if search.statuses:
+        filtered = [v for v in filtered if v["status"] in search.statuses]
+    if search.min_confidence:
+        filtered = [v for v in filtered if v["confidence_score"] >= search.min_confidence]
+    if search.max_confidence:
+        filtered = [v for v in filtered if v["confidence_score"] <= search.max_confidence]
+    if not search.include_false_positives:
+        filtered = [v for v in filtered if not v["is_false_positive"]]
+    if search.search_text:
+        search_lower = search.search_text.lower()
+        filtered = [v for v in filtered if search_lower in v.get("description", "").lower()]
+    filtered.sort(key=lambda v: v["detected_at"], reverse=search.sort_order == "desc")
+    return [v["id"] for v in filtered]
+
+
+# A confidence score present in the data, so >= and <= hit it exactly
+_BOUNDARY = sorted(v["confidence_score"] for v in DEMO_VIOLATIONS)[len(DEMO_VIOLATIONS) // 2]
+_MID_DATE = sorted(v["detected_at"] for v in DEMO_VIOLATIONS)[len(DEMO_VIOLATIONS) // 2]
+
+SEARCHES = {
+    "no filters": {},
+    "types and severities": {
+        "detection_types": [DetectionType.PPE_HARDHAT, DetectionType.PPE_VEST],
+        "severities": [IncidentSeverity.HIGH, IncidentSeverity.CRITICAL],
+    },
+    "min confidence boundary": {"min_confidence": _BOUNDARY, "include_false_positives": True},
+    "max confidence boundary": {"max_confidence": _BOUNDARY},
+    "ascending with site and start date": {
+        "site_ids": ["site-001", "site-003"],
+        "start_date": _MID_DATE,
+        "sort_order": "asc",
+    },
+    "ascending end date and text": {"end_date": _MID_DATE, "search_text": "HARDHAT", "sort_order": "asc"},
+    "inverted date range": {"start_date": _MID_DATE, "end_date": min(v["detected_at"] for v in DEMO_VIOLATIONS)},
+}
+
+
+@pytest.mark.parametrize("filters", SEARCHES.values(), ids=SEARCHES.keys())
+def test_search_matches_linear_scan(filters):
+    search = ForensicsSearchRequest(**filters)
+    assert [v["id"] for v in _search_matches(search)] == _linear_search(search)
+
+
+@pytest.mark.parametrize("sort_order", ["desc", "asc"])
+def test_search_pages_match_linear_scan(client, auth_headers, sort_order):
+    body = {"severities": ["high", "medium", "low"], "sort_order": sort_order}
+    expected = _linear_search(ForensicsSearchRequest(**body))
+    page_size = 7
+    total_pages = (len(expected) + page_size - 1) // page_size
+    
+    for page in range(1, total_pages + 2):  # the last page is past the end
+        response = client.post(
+            "/api/forensics/search",
+            params={"page": page, "page_size": page_size},
+            json=body,
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        start = (page - 1) * page_size
+        assert [item["id"] for item in data["items"]] == expected[start:start + page_size]
+        assert data["total"] == len(expected)
+        assert data["total_pages"] == total_pages
+        assert data["has_next"] == (page < total_pages)
+    assert data["items"] == []
@@ -0,0 +1,64 @@
+"""Per-day forensics stats must stay equal to a recount of the demo data."""
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+
+from api.routes.forensics import DEMO_VIOLATIONS
+from models.schemas import IncidentStatus
+
+
+def _recount(days: int) -> dict:
+    """Stats summary computed from scratch over DEMO_VIOLATIONS."""
+    cutoff = datetime.now() - timedelta(days=days)
+    recent = [v for v in DEMO_VIOLATIONS if v["detected_at"] >= cutoff]
+    high_confidence = sum(1 for v in recent if v["confidence_score"] >= 0.95)
+    return {
+        "total_violations": len(recent),
+        "by_detection_type": dict(Counter(v["detection_type"].value for v in recent)),
+        "by_severity": dict(Counter(v["severity"].value for v in recent)),
+        "high_confidence_count": high_confidence,
+        "high_confidence_percentage": round(high_confidence / max(len(recent), 1) * 100, 1),
+        "false_positive_count": sum(1 for v in recent if v["is_false_positive"]),
+        "resolved_count": sum(1 for v in recent if v["status"] == IncidentStatus.RESOLVED),
+        # Summation order differs from the running totals; allow for the last rounding digit
+        "average_confidence": pytest.approx(
+            sum(v["confidence_score"] for v in recent) / max(len(recent), 1), abs=1e-3
+        ),
+    }
+
+
+@pytest.fixture
+def violation(client, auth_headers):
+    """A violation not yet marked as a false positive; unmarked again afterwards."""
+    violation = next(v for v in DEMO_VIOLATIONS if not v["is_false_positive"])
+    yield violation
+    client.delete(f"/api/forensics/{violation['id']}/false-positive", headers=auth_headers)
+
+
+@pytest.mark.parametrize("days", [3, 30, 365])
+def test_stats_match_recount_after_false_positive(client, auth_headers, violation, days):
+    def summary() -> dict:
+        response = client.get("/api/forensics/stats/summary", params={"days": days}, headers=auth_headers)
+        assert response.status_code == 200
+        return response.json()
+    
+    before = summary()
+    assert before == _recount(days)
+    
+    response = client.post(
+        f"/api/forensics/{violation['id']}/false-positive",
+        json={"reason": "Shadow mistaken for a person"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    # Marking twice must not count twice
+    client.post(
+        f"/api/forensics/{violation['id']}/false-positive",
+        json={"reason": "Shadow mistaken for a person"},
+        headers=auth_headers,
+    )
+    assert summary() == _recount(days)
+    
+    client.delete(f"/api/forensics/{violation['id']}/false-positive", headers=auth_headers)
+    assert summary() == before
@@ -1,12 +1,19 @@
 """Edge Server Configuration."""
 import os
 from datetime import datetime
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class EdgeConfig(BaseSettings):
     """Configuration for the Edge Server."""
     
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        frozen=True,
+        validate_default=False,
+    )
+    
     # Device identification
     edge_device_id: str = os.getenv("EDGE_DEVICE_ID", "edge-001")
     site_id: str = os.getenv("SITE_ID", "site-001")
@@ -63,7 +70,3 @@ class EdgeConfig(BaseSettings):
     
     # Startup time
     start_time: datetime = datetime.utcnow()
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"